@@ -273,8 +273,12 @@ def export_selected_to_usd(file_path: str, asset_library_dir: str, start_frame=N
             static_mesh = smc.static_mesh
             if static_mesh:
                 mesh_name = _sanitize(static_mesh.get_name())
-                mesh_file = f"{mesh_name}.usda"
-                mesh_full = os.path.join(asset_library_dir, mesh_file)
+                # Maya writes library meshes as .usdc by default
+                for ext in (".usdc", ".usda"):
+                    mesh_file = f"{mesh_name}{ext}"
+                    mesh_full = os.path.join(asset_library_dir, mesh_file)
+                    if os.path.exists(mesh_full):
+                        break
                 if lib_exists and os.path.exists(mesh_full):
                     abs_mesh = os.path.abspath(mesh_full).replace("\\", "/")
                     refs = ref_prim.GetReferences()
@@ -422,9 +426,10 @@ def export_selected_to_usd(file_path: str, asset_library_dir: str, start_frame=N
         # Rename our export to BE the override
         os.rename(abs_out, over_path)
 
-        # Re-open and add sublayer reference
-        over_stage = Usd.Stage.Open(over_path)
-        over_root = over_stage.GetRootLayer()
+        # Re-open the layer (no stage composition) and add sublayer reference
+        over_root = Sdf.Layer.FindOrOpen(over_path)
+        # The registry may hold an older copy of this path; re-read the renamed file
+        over_root.Reload()
         over_root.subLayerPaths.append(base_path)
 
         # Add override metadata
@@ -433,7 +438,7 @@ def export_selected_to_usd(file_path: str, asset_library_dir: str, start_frame=N
         custom_data["layoutlink_base_layer"] = base_path
         custom_data["layoutlink_app"] = "unreal"
         over_root.customLayerData = custom_data
-        over_stage.Save()
+        over_root.Save()
 
         unreal.log(f"✓ Updated OVERRIDE: {over_path}")
         unreal.log(f"✓ BASE layer safe: {base_path}")
@@ -66,6 +66,7 @@ def import_usd_from_maya(file_path):
     start_frame = 1
     end_frame = 120
     fps = 24
+    layer = None  # Root layer, reused by the camera scan below
     
     try:
         from pxr import Sdf
@@ -143,13 +144,21 @@ def import_usd_from_maya(file_path):
     try:
         from pxr import Usd, UsdGeom
 
-        stage = Usd.Stage.Open(abs_file_path)
+        # Open from the layer read above instead of resolving the file again
+        stage = Usd.Stage.Open(layer) if layer else Usd.Stage.Open(abs_file_path)
         camera_count = 0
 
-        for prim in stage.TraverseAll():
-            if prim.GetTypeName() == "Camera":
+        # Default predicate skips inactive/abstract prims, prototypes and
+        # instance proxies; IsA avoids a type-name string compare
+        prim_iter = iter(Usd.PrimRange.Stage(stage))
+        for prim in prim_iter:
+            if prim.IsA(UsdGeom.Camera):
                 camera_count += 1
                 unreal.log(f"Found camera in USD: {prim.GetPath()}")
+                prim_iter.PruneChildren()
+            elif prim.IsA(UsdGeom.Gprim):
+                # Nothing camera-like lives under a mesh (only GeomSubsets etc.)
+                prim_iter.PruneChildren()
 
         if camera_count > 0:
             unreal.log(f"Note: {camera_count} camera(s) found in USD")
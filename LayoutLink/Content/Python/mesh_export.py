@@ -80,8 +80,9 @@ def export_mesh_library(output_dir, selected_only=False):
     unreal.log(f"Output directory: {output_dir}")
     
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    created = not os.path.isdir(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    if created:
         unreal.log(f"Created directory: {output_dir}")
     
     # Determine which meshes to export
@@ -4,9 +4,12 @@ Used by both import and export scripts
 """
 
 import unreal
-from datetime import datetime
+import time
 import os
 
+# The login name doesn't change during a session
+_ARTIST = os.getenv('USERNAME', 'unknown')
+
 def add_layoutlink_metadata(layer, operation="export", app="Unreal Engine"):
     """
     Add LayoutLink metadata to a USD layer.
@@ -18,8 +21,8 @@ def add_layoutlink_metadata(layer, operation="export", app="Unreal Engine"):
         app: Which app is creating the file
     """
     custom_data = {
-        "layoutlink_timestamp": datetime.utcnow().isoformat() + 'Z',
-        "layoutlink_artist": os.getenv('USERNAME', 'unknown'),
+        "layoutlink_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "layoutlink_artist": _ARTIST,
         "layoutlink_app": app,
         "layoutlink_operation": operation,
         "layoutlink_version": "0.1.0"
@@ -12,9 +12,32 @@ This is for LAYOUT blocking animation:
 - NOT for character rigs (transform animation only)
 """
 
+import math
+import logging
+
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 from pxr import UsdGeom, Sdf
 
+log = logging.getLogger("LayoutLink.animation")
+
+
+# Transform channels sampled for layout animation
+TRANSFORM_ATTRS = ('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz')
+
+
+# Xform op stack written by export_stepped_animation
+_STEPPED_OP_TYPES = [
+    UsdGeom.XformOp.TypeTranslate,
+    UsdGeom.XformOp.TypeRotateXYZ,
+    UsdGeom.XformOp.TypeScale,
+]
+
+
+def _transform_plugs(maya_object):
+    """Full plug names for all transform channels of an object"""
+    return [f"{maya_object}.{attr}" for attr in TRANSFORM_ATTRS]
+
 
 def is_animated(maya_object):
     """
@@ -26,18 +49,12 @@ def is_animated(maya_object):
     Returns:
         True if object has keyframes, False otherwise
     """
-    # Check all transform channels
-    attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']
-    
-    for attr in attrs:
-        full_attr = f"{maya_object}.{attr}"
-        
-        # Check if this channel has keyframes
-        keyframe_count = cmds.keyframe(full_attr, query=True, keyframeCount=True)
-        if keyframe_count and keyframe_count > 0:
-            return True
+    # Check all transform channels in one query (count is summed across them)
+    keyframe_count = cmds.keyframe(
+        _transform_plugs(maya_object), query=True, keyframeCount=True
+    )
     
-    return False
+    return bool(keyframe_count)
 
 
 def get_all_keyframes(maya_object, start_frame, end_frame):
@@ -58,28 +75,16 @@ def get_all_keyframes(maya_object, start_frame, end_frame):
         [1.0, 24.0, 48.0, 100.0]
     """
     
-    keyframes = set()
+    # Keys in range on all transform channels, merged by one query
+    # (unkeyed channels simply contribute nothing)
+    keys = cmds.keyframe(
+        _transform_plugs(maya_object),
+        query=True,
+        time=(start_frame, end_frame),
+        timeChange=True
+    )
     
-    # Check all transform channels
-    attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']
-    
-    for attr in attrs:
-        full_attr = f"{maya_object}.{attr}"
-        
-        # Check if animated
-        keyframe_count = cmds.keyframe(full_attr, query=True, keyframeCount=True)
-        
-        if keyframe_count and keyframe_count > 0:
-            # Get keyframes in this range
-            keys = cmds.keyframe(
-                full_attr,
-                query=True,
-                time=(start_frame, end_frame),
-                timeChange=True
-            )
-            
-            if keys:
-                keyframes.update(keys)
+    keyframes = set(keys or ())
     
     # Always include first and last frame (even if no keys there)
     if keyframes:
@@ -89,6 +94,36 @@ def get_all_keyframes(maya_object, start_frame, end_frame):
     return sorted(list(keyframes))
 
 
+def sample_world_transform(maya_object, frame):
+    """
+    Sample world-space translate, rotate (XYZ, degrees) and scale at a frame.
+    
+    Evaluates worldMatrix at the given time with one getAttr, so the
+    timeline is never moved (no scene-wide DG evaluation or redraw).
+    
+    Args:
+        maya_object: Maya transform node
+        frame: Frame to sample
+        
+    Returns:
+        Tuple of (translate, rotate, scale) 3-tuples
+    """
+    matrix = om.MMatrix(
+        cmds.getAttr(f"{maya_object}.worldMatrix[0]", time=frame)
+    )
+    xform_mtx = om.MTransformationMatrix(matrix)
+    
+    t = xform_mtx.translation(om.MSpace.kWorld)
+    r = xform_mtx.rotation()  # MEulerRotation, XYZ order, radians
+    s = xform_mtx.scale(om.MSpace.kWorld)
+    
+    return (
+        (t.x, t.y, t.z),
+        (math.degrees(r.x), math.degrees(r.y), math.degrees(r.z)),
+        (s[0], s[1], s[2]),
+    )
+
+
 def export_stepped_animation(maya_object, prim, start_frame, end_frame):
     """
     Export stepped (held) animation from Maya to USD prim.
@@ -118,11 +153,11 @@ def export_stepped_animation(maya_object, prim, start_frame, end_frame):
     
     if not keyframes or len(keyframes) <= 1:
         # No animation or only 1 keyframe
-        print(f"  No animation on {maya_object}")
+        log.debug("  No animation on %s", maya_object)
         return False
     
-    print(f"  Exporting {len(keyframes)} keyframes (STEPPED)")
-    print(f"    Frames: {keyframes}")
+    log.debug("  Exporting %d keyframes (STEPPED)", len(keyframes))
+    log.debug("    Frames: %s", keyframes)
     
     # Sample transform at each keyframe
     translate_samples = {}
@@ -130,37 +165,38 @@ def export_stepped_animation(maya_object, prim, start_frame, end_frame):
     scale_samples = {}
     
     for frame in keyframes:
-        # Jump to this frame
-        cmds.currentTime(frame)
-        
-        # Get world-space transform at this frame
-        t = cmds.xform(maya_object, query=True, worldSpace=True, translation=True)
-        r = cmds.xform(maya_object, query=True, worldSpace=True, rotation=True)
-        s = cmds.xform(maya_object, query=True, worldSpace=True, scale=True)
+        # Get world-space transform at this frame (timeline stays put)
+        t, r, s = sample_world_transform(maya_object, frame)
         
         # Store samples
-        translate_samples[frame] = (t[0], t[1], t[2])
-        rotate_samples[frame] = (r[0], r[1], r[2])
-        scale_samples[frame] = (s[0], s[1], s[2])
+        translate_samples[frame] = t
+        rotate_samples[frame] = r
+        scale_samples[frame] = s
     
     # Write to USD with time-varying transform ops
     xformable = UsdGeom.Xformable(prim)
-    xformable.ClearXformOpOrder()
-    
-    # Create transform ops
-    translate_op = xformable.AddTranslateOp()
-    rotate_op = xformable.AddRotateXYZOp()
-    scale_op = xformable.AddScaleOp()
-    
-    # Write all samples as timeSamples
-    for frame, value in translate_samples.items():
-        translate_op.Set(value, frame)
     
-    for frame, value in rotate_samples.items():
-        rotate_op.Set(value, frame)
+    # Reuse a translate/rotateXYZ/scale stack if the prim already has one,
+    # otherwise rebuild it
+    ops = xformable.GetOrderedXformOps()
+    if [op.GetOpType() for op in ops] == _STEPPED_OP_TYPES:
+        translate_op, rotate_op, scale_op = ops
+    else:
+        xformable.ClearXformOpOrder()
+        translate_op = xformable.AddTranslateOp()
+        rotate_op = xformable.AddRotateXYZOp()
+        scale_op = xformable.AddScaleOp()
     
-    for frame, value in scale_samples.items():
-        scale_op.Set(value, frame)
+    # Write all samples as timeSamples (one change notification for all of them)
+    with Sdf.ChangeBlock():
+        for frame, value in translate_samples.items():
+            translate_op.Set(value, frame)
+        
+        for frame, value in rotate_samples.items():
+            rotate_op.Set(value, frame)
+        
+        for frame, value in scale_samples.items():
+            scale_op.Set(value, frame)
     
     # CRITICAL: Set interpolation to HELD (stepped, no interpolation)
     # USD uses "held" for stepped/constant interpolation
@@ -172,13 +208,21 @@ def export_stepped_animation(maya_object, prim, start_frame, end_frame):
     else:
         usd_prim = prim
     
-    usd_prim.CreateAttribute("interpolation", Sdf.ValueTypeNames.Token).Set("held")
+    # Author on the edit target's prim spec directly when it has one
+    prim_spec = usd_prim.GetStage().GetEditTarget().GetPrimSpecForScenePath(usd_prim.GetPath())
+    if prim_spec and "interpolation" not in prim_spec.attributes:
+        interp_spec = Sdf.AttributeSpec(
+            prim_spec, "interpolation", Sdf.ValueTypeNames.Token,
+            Sdf.VariabilityVarying, declaresCustom=True
+        )
+        interp_spec.default = "held"
+    else:
+        usd_prim.CreateAttribute("interpolation", Sdf.ValueTypeNames.Token).Set("held")
     
     # 2. TODO: Set stage-level interpolation when we create the stage
     # (This happens in maya_layout_export.py, not here)
     
-    print(f"  ✓ Exported stepped animation")
-    print(f"    Range: frames {keyframes[0]}-{keyframes[-1]}")
+    log.debug("  Exported stepped animation, frames %s-%s", keyframes[0], keyframes[-1])
     
     return True
 
@@ -8,26 +8,34 @@ Professional workflow using USD references and composition.
 
 import os
 import sys
-import datetime
+import time
+import logging
+import collections
 
 import maya.cmds as cmds
+import maya.api.OpenMayaAnim as oma
 
 # Add current directory to path for imports
 current_dir = os.path.dirname(__file__) if __file__ else os.getcwd()
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-# Import backend modules
-import maya_mesh_export
-import maya_layout_export
-import maya_layout_import
-import quick_updater 
+# Backend modules (maya_mesh_export, maya_layout_export, maya_layout_import,
+# quick_updater) pull in pxr, so they are imported inside the button handlers
+# that use them rather than at module load.
 
 from PySide6 import QtWidgets, QtCore
-from shiboken6 import wrapInstance
-import maya.OpenMayaUI as omui
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 
+# All LayoutLink modules log under the "LayoutLink" logger; per-object detail
+# is at debug level. Enable it with:
+#     logging.getLogger("LayoutLink").setLevel(logging.DEBUG)
+logging.getLogger("LayoutLink").addHandler(logging.NullHandler())
+
+# Tracebacks go through logging (Maya shows errors in the Script Editor)
+# rather than into the status log widget
+log = logging.getLogger("LayoutLink.ui")
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -40,25 +48,46 @@ class Config:
     ASSET_LIBRARY_VAR = "layoutlink_asset_library"
     LAYOUT_EXPORT_VAR = "layoutlink_layout_export"
 
+    # optionVar values read this session; the setters keep it current
+    _cache = {}
+
+    @classmethod
+    def _get_option(cls, var, default):
+        if var not in cls._cache:
+            if cmds.optionVar(exists=var):
+                cls._cache[var] = cmds.optionVar(q=var)
+            else:
+                cls._cache[var] = default
+        return cls._cache[var]
+
+    @classmethod
+    def _set_option(cls, var, value):
+        # Exports save the settings every time; skip the write if unchanged
+        if cls._cache.get(var) == value:
+            return
+        cmds.optionVar(sv=(var, value))
+        cls._cache[var] = value
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Re-read optionVars on next access (e.g. after editing them from MEL)"""
+        cls._cache.clear()
+
     @classmethod
     def get_asset_library(cls):
-        if cmds.optionVar(exists=cls.ASSET_LIBRARY_VAR):
-            return cmds.optionVar(q=cls.ASSET_LIBRARY_VAR)
-        return "C:/SharedUSD/assets/maya"
+        return cls._get_option(cls.ASSET_LIBRARY_VAR, "C:/SharedUSD/assets/maya")
 
     @classmethod
     def set_asset_library(cls, path):
-        cmds.optionVar(sv=(cls.ASSET_LIBRARY_VAR, path))
+        cls._set_option(cls.ASSET_LIBRARY_VAR, path)
 
     @classmethod
     def get_layout_export(cls):
-        if cmds.optionVar(exists=cls.LAYOUT_EXPORT_VAR):
-            return cmds.optionVar(q=cls.LAYOUT_EXPORT_VAR)
-        return "C:/SharedUSD/layouts/maya_layouts"
+        return cls._get_option(cls.LAYOUT_EXPORT_VAR, "C:/SharedUSD/layouts/maya_layouts")
 
     @classmethod
     def set_layout_export(cls, path):
-        cmds.optionVar(sv=(cls.LAYOUT_EXPORT_VAR, path))
+        cls._set_option(cls.LAYOUT_EXPORT_VAR, path)
 
 
 # ============================================================================
@@ -66,13 +95,100 @@ class Config:
 # ============================================================================
 
 
+class _LayoutProbeSignals(QtCore.QObject):
+    # (file_path, probe dict or None)
+    finished = QtCore.Signal(str, object)
+
+
+class _LayoutProbeWorker(QtCore.QRunnable):
+    """
+    Runs maya_layout_import.probe_layout off the UI thread.
+
+    The probe only opens an anonymous, metadata-only copy of the file (never
+    a registry layer a mayaUsd stage may own), and only plain values come
+    back - any layer the import needs is opened on the main thread.
+    """
+
+    # Plain values handed back to the main thread
+    PROBE_KEYS = ("layer_type", "base_layer", "up_axis")
+
+    def __init__(self, probe_func, file_path):
+        super(_LayoutProbeWorker, self).__init__()
+        self.probe_func = probe_func
+        self.file_path = file_path
+        self.signals = _LayoutProbeSignals()
+
+    def run(self):
+        try:
+            result = self.probe_func(self.file_path)
+            probe = {key: result[key] for key in self.PROBE_KEYS}
+        except Exception:
+            # Let the import on the main thread retry and report the error
+            probe = None
+        self.signals.finished.emit(self.file_path, probe)
+
+
 class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     WINDOW_TITLE = "LayoutLink"
     WINDOW_OBJECT = "LayoutLinkWindow"
 
+    # Lines kept in the status log
+    STATUS_LOG_MAX_LINES = 500
+    # Delay before buffered log lines are written to the widget
+    LOG_FLUSH_MS = 50
+
+    # Button labels
+    MESH_BTN_LABEL = "📦 Export Mesh Library (Selected)"
+    LAYOUT_BTN_LABEL = "📤 Export Layout (Selected)"
+    IMPORT_BTN_LABEL = "📥 Import Layout from Unreal"
+    UPDATE_BTN_LABEL = "🔄 Update from Unreal"
+
+    # One stylesheet for the panel's styled widgets (action buttons and
+    # section labels), matched by objectName, so Qt parses it once per panel
+    # instead of once per widget
+    PANEL_QSS = """
+        QLabel#headerLabel { font-size: 14px; font-weight: bold; padding: 10px; }
+        QLabel#frameRangeLabel { font-weight: bold; margin-top: 10px; }
+        QPushButton#meshExportBtn, QPushButton#layoutExportBtn,
+        QPushButton#importBtn, QPushButton#updateBtn {
+            color: white;
+            font-size: 13px;
+            font-weight: bold;
+            padding: 12px;
+            border-radius: 5px;
+        }
+        QPushButton#meshExportBtn { background-color: #2196F3; }
+        QPushButton#meshExportBtn:hover { background-color: #1976D2; }
+        QPushButton#meshExportBtn:pressed { background-color: #0D47A1; }
+        QPushButton#layoutExportBtn { background-color: #4CAF50; }
+        QPushButton#layoutExportBtn:hover { background-color: #45a049; }
+        QPushButton#layoutExportBtn:pressed { background-color: #3d8b40; }
+        QPushButton#importBtn { background-color: #FF9800; }
+        QPushButton#importBtn:hover { background-color: #F57C00; }
+        QPushButton#importBtn:pressed { background-color: #E65100; }
+        QPushButton#updateBtn { background-color: #9C27B0; }
+        QPushButton#updateBtn:hover { background-color: #7B1FA2; }
+        QPushButton#updateBtn:pressed { background-color: #4A148C; }
+    """
+
     def __init__(self, parent=None):
         super(LayoutLinkUI, self).__init__(parent=parent)
 
+        # Cached status-log timestamp (see _flush_log())
+        self._last_ts_sec = None
+        self._last_ts_str = ""
+
+        # Layout probe running on the thread pool (see on_import_layout)
+        self._probe_worker = None
+
+        # Pending status-log lines, flushed to the widget in one append
+        # (bounded, so a hidden panel only keeps what the widget would show)
+        self._log_buf = collections.deque(maxlen=self.STATUS_LOG_MAX_LINES)
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self.setObjectName(self.WINDOW_OBJECT)
         self.setWindowTitle(self.WINDOW_TITLE)
 
@@ -81,10 +197,11 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
     def setup_ui(self):
         main_layout = QtWidgets.QVBoxLayout(self)
         self.setLayout(main_layout)
+        self.setStyleSheet(self.PANEL_QSS)
 
         # Header
         header = QtWidgets.QLabel("LayoutLink - Professional USD Pipeline")
-        header.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        header.setObjectName("headerLabel")
         header.setAlignment(QtCore.Qt.AlignCenter)
         main_layout.addWidget(header)
 
@@ -94,9 +211,12 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         settings_group = QtWidgets.QGroupBox("Settings")
         settings_layout = QtWidgets.QFormLayout()
 
+        asset_lib = Config.get_asset_library()
+        layout_dir = Config.get_layout_export()
+
         # Asset Library Path
         asset_layout = QtWidgets.QHBoxLayout()
-        self.asset_library_input = QtWidgets.QLineEdit(Config.get_asset_library())
+        self.asset_library_input = QtWidgets.QLineEdit(asset_lib)
         asset_browse_btn = QtWidgets.QPushButton("Browse...")
         asset_browse_btn.clicked.connect(self.browse_asset_library)
         asset_layout.addWidget(self.asset_library_input)
@@ -105,7 +225,7 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 
         # Layout Export Path
         layout_layout = QtWidgets.QHBoxLayout()
-        self.layout_export_input = QtWidgets.QLineEdit(Config.get_layout_export())
+        self.layout_export_input = QtWidgets.QLineEdit(layout_dir)
         layout_browse_btn = QtWidgets.QPushButton("Browse...")
         layout_browse_btn.clicked.connect(self.browse_layout_export)
         layout_layout.addWidget(self.layout_export_input)
@@ -123,7 +243,7 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         
                 # Frame Range Controls
         frame_range_label = QtWidgets.QLabel("Animation Frame Range:")
-        frame_range_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        frame_range_label.setObjectName("frameRangeLabel")
         export_layout.addWidget(frame_range_label)
 
         frame_controls = QtWidgets.QHBoxLayout()
@@ -155,42 +275,14 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         export_layout.addLayout(frame_controls)
 
         # Export Mesh Library Button
-        self.mesh_export_btn = QtWidgets.QPushButton(
-            "📦 Export Mesh Library (Selected)"
-        )
-        self.mesh_export_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 12px;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #1976D2; }
-            QPushButton:pressed { background-color: #0D47A1; }
-        """
-        )
+        self.mesh_export_btn = QtWidgets.QPushButton(self.MESH_BTN_LABEL)
+        self.mesh_export_btn.setObjectName("meshExportBtn")
         self.mesh_export_btn.clicked.connect(self.on_export_mesh_library)
         export_layout.addWidget(self.mesh_export_btn)
 
         # Export Layout Button
-        self.layout_export_btn = QtWidgets.QPushButton("📤 Export Layout (Selected)")
-        self.layout_export_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 12px;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-            QPushButton:pressed { background-color: #3d8b40; }
-        """
-        )
+        self.layout_export_btn = QtWidgets.QPushButton(self.LAYOUT_BTN_LABEL)
+        self.layout_export_btn.setObjectName("layoutExportBtn")
         self.layout_export_btn.clicked.connect(self.on_export_layout)
         export_layout.addWidget(self.layout_export_btn)
 
@@ -204,21 +296,8 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         import_layout = QtWidgets.QVBoxLayout()
 
         # Import Button
-        self.import_btn = QtWidgets.QPushButton("📥 Import Layout from Unreal")
-        self.import_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 12px;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #F57C00; }
-            QPushButton:pressed { background-color: #E65100; }
-        """
-        )
+        self.import_btn = QtWidgets.QPushButton(self.IMPORT_BTN_LABEL)
+        self.import_btn.setObjectName("importBtn")
         self.import_btn.clicked.connect(self.on_import_layout)
         import_layout.addWidget(self.import_btn)
 
@@ -226,21 +305,8 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         main_layout.addWidget(import_group)
         
         # Quick Update Button
-        self.update_btn = QtWidgets.QPushButton("🔄 Update from Unreal")
-        self.update_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #9C27B0;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 12px;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #7B1FA2; }
-            QPushButton:pressed { background-color: #4A148C; }
-        """
-        )
+        self.update_btn = QtWidgets.QPushButton(self.UPDATE_BTN_LABEL)
+        self.update_btn.setObjectName("updateBtn")
         self.update_btn.clicked.connect(self.on_update_from_unreal)
         import_layout.addWidget(self.update_btn)
 
@@ -250,15 +316,19 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
         status_label = QtWidgets.QLabel("Status Log:")
         main_layout.addWidget(status_label)
 
-        self.status_text = QtWidgets.QTextEdit()
+        # Plain-text, append-only log; old lines are trimmed past the cap
+        self.status_text = QtWidgets.QPlainTextEdit()
         self.status_text.setReadOnly(True)
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setCenterOnScroll(False)
+        self.status_text.setMaximumBlockCount(self.STATUS_LOG_MAX_LINES)
         self.status_text.setMaximumHeight(150)
         main_layout.addWidget(self.status_text)
 
         # Initial log message
         self.log("LayoutLink ready. Select objects and click export buttons.")
-        self.log(f"Asset Library: {Config.get_asset_library()}")
-        self.log(f"Layout Export: {Config.get_layout_export()}")
+        self.log(f"Asset Library: {asset_lib}")
+        self.log(f"Layout Export: {layout_dir}")
 
         # Initialize from current timeline
         self.sync_frame_range_from_timeline()
@@ -269,50 +339,60 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 
     def on_export_mesh_library(self):
         """Export selected meshes to USD asset library"""
-        self.log("\n=== Starting Mesh Library Export ===")
-
-        # Save settings
-        Config.set_asset_library(self.asset_library_input.text())
-        asset_lib = Config.get_asset_library()
+        self.mesh_export_btn.setEnabled(False)
+        try:
+            self.log("\n=== Starting Mesh Library Export ===")
 
-        # Check selection
-        selection = cmds.ls(selection=True)
-        if not selection:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "No Selection",
-                "Please select one or more mesh objects before exporting.",
-            )
-            self.log("ERROR: No objects selected")
-            return
+            # Save settings
+            Config.set_asset_library(self.asset_library_input.text())
+            asset_lib = Config.get_asset_library()
 
-        self.log(f"Exporting to: {asset_lib}")
+            # Check selection (queried once and handed to the exporter)
+            selection = cmds.ls(selection=True, long=True, transforms=True)
+            if not selection:
+                QtWidgets.QMessageBox.warning(
+                    self,
+                    "No Selection",
+                    "Please select one or more mesh objects before exporting.",
+                )
+                self.log("ERROR: No objects selected")
+                return
 
-        try:
-            # Call backend export
-            result = maya_mesh_export.export_selected_meshes_library(asset_lib)
+            self.log(f"Exporting to: {asset_lib}")
 
-            if result["success"]:
-                self.log(f"Success! Exported {result['exported_count']} mesh(es)")
-                if result["failed_count"] > 0:
-                    self.log(f"Failed: {result['failed_count']} mesh(es)")
+            try:
+                import maya_mesh_export
 
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Export Complete",
-                    f"Exported {result['exported_count']} meshes to asset library.",
+                # Call backend export
+                result = maya_mesh_export.export_selected_meshes_library(
+                    asset_lib, selection=selection
                 )
-            else:
-                self.log(f"Export failed: {result.get('error', 'Unknown error')}")
 
-        except Exception as e:
-            self.log(f"ERROR: {e}")
-            QtWidgets.QMessageBox.critical(
-                self, "Export Failed", f"An error occurred:\n{e}"
-            )
+                if result["success"]:
+                    self.log(f"Success! Exported {result['exported_count']} mesh(es)")
+                    if result["failed_count"] > 0:
+                        self.log(f"Failed: {result['failed_count']} mesh(es)")
+
+                    QtWidgets.QMessageBox.information(
+                        self,
+                        "Export Complete",
+                        f"Exported {result['exported_count']} meshes to asset library.",
+                    )
+                else:
+                    self.log(f"Export failed: {result.get('error', 'Unknown error')}")
+
+            except Exception as e:
+                self.log(f"ERROR: {e}")
+                QtWidgets.QMessageBox.critical(
+                    self, "Export Failed", f"An error occurred:\n{e}"
+                )
+        finally:
+            self.mesh_export_btn.setEnabled(True)
 
     def on_export_layout(self):
         """Export selected objects as layout with references"""
+        self.layout_export_btn.setEnabled(False)
+        dialog_scheduled = False
         try:
             self.log("\n=== Starting Layout Export ===")
 
@@ -323,8 +403,8 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             asset_lib = Config.get_asset_library()
             layout_dir = Config.get_layout_export()
 
-            # Check selection
-            selection = cmds.ls(selection=True)
+            # Check selection (queried once and handed to the exporter)
+            selection = cmds.ls(selection=True, long=True, transforms=True)
             if not selection:
                 QtWidgets.QMessageBox.warning(
                     self,
@@ -335,24 +415,32 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                 return
 
             # Create layout directory if needed
-            if not os.path.exists(layout_dir):
-                os.makedirs(layout_dir)
+            created = not os.path.isdir(layout_dir)
+            os.makedirs(layout_dir, exist_ok=True)
+            if created:
                 self.log(f"Created directory: {layout_dir}")
 
             # Get filename - Use QTimer to defer dialog after Qt events
             self.log("Preparing file dialog...")
 
             # Store context for deferred execution
-            self._export_context = {"asset_lib": asset_lib, "layout_dir": layout_dir}
+            self._export_context = {
+                "asset_lib": asset_lib,
+                "layout_dir": layout_dir,
+                "selection": selection,
+            }
 
             # Use QTimer.singleShot to delay dialog until after button click completes
             QtCore.QTimer.singleShot(0, self._show_export_dialog)
+            dialog_scheduled = True
 
         except Exception as e:
-            self.log(f"ERROR in on_export_layout: {e}")
-            import traceback
+            self._log_exception(e, "in on_export_layout")
 
-            self.log(traceback.format_exc())
+        finally:
+            # Otherwise _show_export_dialog re-enables it once the export is done
+            if not dialog_scheduled:
+                self.layout_export_btn.setEnabled(True)
 
     def _show_export_dialog(self):
         """Deferred function to show export dialog (called via QTimer)"""
@@ -384,11 +472,14 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 
             self.log(f"Exporting with frame range: {start_frame}-{end_frame}")
 
+            import maya_layout_export
+
             result = maya_layout_export.export_selected_to_usd(
                 file_path[0],
                 asset_lib,
                 start_frame=start_frame,
                 end_frame=end_frame,
+                selection=self._export_context["selection"],
             )
 
             if result["success"]:
@@ -406,17 +497,48 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                 self.log(f"Export failed: {result.get('error')}")
 
         except Exception as e:
-            self.log(f"ERROR: {e}")
-            import traceback
+            self._log_exception(e)
 
-            self.log(traceback.format_exc())
+        finally:
+            self.layout_export_btn.setEnabled(True)
 
     def on_import_layout(self):
         """Import USD layout from Unreal as USD Stage"""
+        self.import_btn.setEnabled(False)
         self.log("\n=== Starting Layout Import ===")
+        probe_started = False
+
+        try:
+            import maya_layout_import
+
+            file_path = maya_layout_import.pick_layout_file()
+            if not file_path:
+                self.log("Import cancelled")
+                return
 
+            # Read the file on a worker thread; the Maya side of the import
+            # runs in _on_layout_probed back on the main thread
+            self.log(f"Reading: {file_path}")
+            worker = _LayoutProbeWorker(maya_layout_import.probe_layout, file_path)
+            worker.signals.finished.connect(self._on_layout_probed)
+            self._probe_worker = worker
+            QtCore.QThreadPool.globalInstance().start(worker)
+            probe_started = True
+
+        except Exception as e:
+            self._log_exception(e)
+
+        finally:
+            if not probe_started:
+                self.import_btn.setEnabled(True)
+
+    def _on_layout_probed(self, file_path, probe):
+        """Finish a layout import once the worker has read the file"""
+        self._probe_worker = None
         try:
-            result = maya_layout_import.import_with_file_dialog()
+            import maya_layout_import
+
+            result = maya_layout_import.import_usd_from_unreal(file_path, probe=probe)
 
             if result["success"]:
                 self.log(f"Success! Created USD Stage")
@@ -427,109 +549,132 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                     self.log(f"Import failed: {result.get('error')}")
 
         except Exception as e:
-            self.log(f"ERROR: {e}")
-            import traceback
+            self._log_exception(e)
 
-            self.log(traceback.format_exc())
+        finally:
+            self.import_btn.setEnabled(True)
 
     def on_update_from_unreal(self):
         """Quick update existing USD stage with Unreal changes"""
-        import quick_updater
-        
-        self.log("\n=== Quick Update from Unreal ===")
+        self.update_btn.setEnabled(False)
+        try:
+            self.log("\n=== Quick Update from Unreal ===")
+
+            # Stages are mayaUsdProxyShapes - first use loads the plugin
+            import maya_layout_import
+
+            if not maya_layout_import.ensure_mayausd_plugin():
+                self.log("ERROR: mayaUsd plugin could not be loaded")
+                return
+
+            import quick_updater
         
-        # Find all USD stages in scene
-        stages = quick_updater.list_all_usd_stages()
+            # Find all USD stages in scene
+            stages = quick_updater.list_all_usd_stages()
         
-        if not stages:
-            QtWidgets.QMessageBox.warning(
-                self, "No USD Stages",
-                "No USD stages found in scene.\n\n"
-                "Import a layout first, then use Update to refresh it."
-            )
-            self.log("ERROR: No USD stages in scene")
-            return
+            if not stages:
+                QtWidgets.QMessageBox.warning(
+                    self, "No USD Stages",
+                    "No USD stages found in scene.\n\n"
+                    "Import a layout first, then use Update to refresh it."
+                )
+                self.log("ERROR: No USD stages in scene")
+                return
         
-        self.log(f"Found {len(stages)} USD stage(s) in scene")
+            self.log(f"Found {len(stages)} USD stage(s) in scene")
         
-        # If multiple stages, let user pick which one to update
-        selected_stage = None
+            # If multiple stages, let user pick which one to update
+            selected_stage = None
         
-        if len(stages) > 1:
-            # Show selection dialog
-            stage_names = [s.split('|')[-1] for s in stages]  # Short names
+            if len(stages) > 1:
+                # Show selection dialog, listing stages by short name
+                # (the full DAG path is shown if a short name repeats)
+                name_to_stage = {}
+                for stage in stages:
+                    short_name = stage.rsplit('|', 1)[-1]
+                    name_to_stage[stage if short_name in name_to_stage else short_name] = stage
             
-            item, ok = QtWidgets.QInputDialog.getItem(
-                self, "Select Stage to Update",
-                "Multiple USD stages found.\nWhich one should be updated with Unreal changes?",
-                stage_names, 0, False
-            )
+                item, ok = QtWidgets.QInputDialog.getItem(
+                    self, "Select Stage to Update",
+                    "Multiple USD stages found.\nWhich one should be updated with Unreal changes?",
+                    list(name_to_stage), 0, False
+                )
             
-            if not ok:
-                self.log("Update cancelled")
-                return
+                if not ok:
+                    self.log("Update cancelled")
+                    return
             
-            # Find the full path for selected stage
-            idx = stage_names.index(item)
-            selected_stage = stages[idx]
+                # Find the full path for selected stage
+                selected_stage = name_to_stage[item]
             
-        else:
-            # Only one stage - use it
-            selected_stage = stages[0]
+            else:
+                # Only one stage - use it
+                selected_stage = stages[0]
         
-        stage_short_name = selected_stage.split('|')[-1]
-        self.log(f"Updating stage: {stage_short_name}")
+            stage_short_name = selected_stage.rsplit('|', 1)[-1]
+            self.log(f"Updating stage: {stage_short_name}")
         
-        # Get current file info
-        info = quick_updater.get_stage_info(selected_stage)
-        if info:
-            self.log(f"  Current file: {os.path.basename(info['file_path'])}")
-            self.log(f"  Layer type: {info['layer_type']}")
+            # Get current file info
+            info = quick_updater.get_stage_info(selected_stage)
+            if info:
+                self.log(f"  Current file: {os.path.basename(info['file_path'])}")
+                self.log(f"  Layer type: {info['layer_type']}")
         
-        # Do the update!
-        try:
-            result = quick_updater.update_existing_stage(selected_stage)
+            # Do the update!
+            try:
+                result = quick_updater.update_existing_stage(selected_stage)
             
-            if result["success"]:
-                old_name = os.path.basename(result['old_path'])
-                new_name = os.path.basename(result['new_path'])
+                if result["success"] and result.get("message") == "Already up to date":
+                    new_name = os.path.basename(result['new_path'])
                 
-                self.log("✅ Update Complete!")
-                self.log(f"  From: {old_name}")
-                self.log(f"  To: {new_name}")
+                    self.log(f"✓ {stage_short_name} already up to date ({new_name})")
                 
-                QtWidgets.QMessageBox.information(
-                    self, "Update Complete",
-                    f"Stage updated with Unreal changes!\n\n"
-                    f"Stage: {stage_short_name}\n"
-                    f"New file: {new_name}\n\n"
-                    f"✓ Updated in <10 seconds\n"
-                    f"✓ Animation preserved\n"
-                    f"✓ Scene setup unchanged"
-                )
-            else:
-                error = result.get('error', 'Unknown error')
-                self.log(f"❌ Update failed: {error}")
+                    QtWidgets.QMessageBox.information(
+                        self, "Already Up To Date",
+                        f"Stage already shows the latest Unreal changes.\n\n"
+                        f"Stage: {stage_short_name}\n"
+                        f"File: {new_name}"
+                    )
+                elif result["success"]:
+                    old_name = os.path.basename(result['old_path'])
+                    new_name = os.path.basename(result['new_path'])
                 
-                QtWidgets.QMessageBox.warning(
-                    self, "Update Failed",
-                    f"Could not update stage:\n\n{error}\n\n"
-                    f"Common issues:\n"
-                    f"• Unreal hasn't exported yet\n"
-                    f"• Wrong filename (must match BASE layer name)\n"
-                    f"• File not found\n\n"
-                    f"Make sure Unreal exports with the same shot name!"
-                )
+                    self.log("✅ Update Complete!")
+                    self.log(f"  From: {old_name}")
+                    self.log(f"  To: {new_name}")
+                
+                    QtWidgets.QMessageBox.information(
+                        self, "Update Complete",
+                        f"Stage updated with Unreal changes!\n\n"
+                        f"Stage: {stage_short_name}\n"
+                        f"New file: {new_name}\n\n"
+                        f"✓ Updated in <10 seconds\n"
+                        f"✓ Animation preserved\n"
+                        f"✓ Scene setup unchanged"
+                    )
+                else:
+                    error = result.get('error', 'Unknown error')
+                    self.log(f"❌ Update failed: {error}")
+                
+                    QtWidgets.QMessageBox.warning(
+                        self, "Update Failed",
+                        f"Could not update stage:\n\n{error}\n\n"
+                        f"Common issues:\n"
+                        f"• Unreal hasn't exported yet\n"
+                        f"• Wrong filename (must match BASE layer name)\n"
+                        f"• File not found\n\n"
+                        f"Make sure Unreal exports with the same shot name!"
+                    )
         
-        except Exception as e:
-            self.log(f"ERROR: {e}")
-            import traceback
-            self.log(traceback.format_exc())
+            except Exception as e:
+                self._log_exception(e)
             
-            QtWidgets.QMessageBox.critical(
-                self, "Update Error",
-                f"An error occurred:\n\n{e}"
-            )
+                QtWidgets.QMessageBox.critical(
+                    self, "Update Error",
+                    f"An error occurred:\n\n{e}"
+                )
+        finally:
+            self.update_btn.setEnabled(True)
         
     # ========================================================================
     # HELPER FUNCTIONS
@@ -561,16 +706,62 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 
     def log(self, message):
         """Add message to status log"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.status_text.append(f"[{timestamp}] {message}")
+        # Only the raw second is recorded here; formatting happens in _flush_log
+        self._log_buf.append((int(time.time()), message))
+        # While the panel is hidden lines just wait in the buffer (see showEvent)
+        if not self._log_timer.isActive() and self.isVisible():
+            self._log_timer.start()
+
+    def showEvent(self, event):
+        super(LayoutLinkUI, self).showEvent(event)
+        # Write out anything logged while the panel was hidden
+        if self._log_buf:
+            self._log_timer.start()
+
+    def _log_exception(self, e, context=""):
+        """Log an error: short message in the panel, traceback to the Script Editor"""
+        message = f"ERROR {context}: {e}" if context else f"ERROR: {e}"
+        log.exception(message)
+        self.log(f"{message} (traceback in Script Editor)")
+
+    def _flush_log(self):
+        """Append all buffered log lines to the status log at once"""
+        if not self._log_buf or not self.status_text.isVisible():
+            return
+
+        # Format each distinct second once per flush (bursts share a second)
+        lines = []
+        for sec, message in self._log_buf:
+            if sec != self._last_ts_sec:
+                self._last_ts_sec = sec
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            if not isinstance(message, str):
+                message = str(message)
+            lines.append("[" + self._last_ts_str + "] " + message)
+        self._log_buf.clear()
+
+        # Follow new lines only if the user hasn't scrolled up to read
+        scroll_bar = self.status_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        scroll_pos = scroll_bar.value()
+
+        self.status_text.appendPlainText("\n".join(lines))
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+        else:
+            scroll_bar.setValue(scroll_pos)
         
     def sync_frame_range_from_timeline(self):
         """Sync frame range spinboxes from Maya timeline"""
-        start = int(cmds.playbackOptions(query=True, minTime=True))
-        end = int(cmds.playbackOptions(query=True, maxTime=True))
+        # Direct API getters, no command dispatch (value is in the scene's time unit)
+        start = int(oma.MAnimControl.minTime().value)
+        end = int(oma.MAnimControl.maxTime().value)
 
-        self.start_frame_spin.setValue(start)
-        self.end_frame_spin.setValue(end)
+        # Programmatic update - don't emit valueChanged for it
+        with QtCore.QSignalBlocker(self.start_frame_spin), QtCore.QSignalBlocker(self.end_frame_spin):
+            self.start_frame_spin.setValue(start)
+            self.end_frame_spin.setValue(end)
 
         # Only log if status_text exists (skip during initialization)
         if hasattr(self, "status_text"):
@@ -582,24 +773,37 @@ class LayoutLinkUI(MayaQWidgetDockableMixin, QtWidgets.QWidget):
 # ============================================================================
 
 
+# Last UI instance created by show_ui()
+_current_ui = None
+
+
 def show_ui():
     """Show the LayoutLink UI as a dockable window"""
+    global _current_ui
 
-    # Delete existing instance
+    # Reuse existing instance - just bring the panel back up
     workspace_control_name = LayoutLinkUI.WINDOW_OBJECT + "WorkspaceControl"
     if cmds.workspaceControl(workspace_control_name, exists=True):
+        if _current_ui is not None:
+            cmds.workspaceControl(workspace_control_name, edit=True, restore=True)
+            return _current_ui
+
+        # Control left over from a previous module load - rebuild it
         cmds.deleteUI(workspace_control_name)
 
-    # Create new instance
-    ui = LayoutLinkUI()
-    ui.show(dockable=True)
+    # Create new instance (mayaUsd is loaded by the buttons that need it,
+    # so opening the panel stays fast)
+    _current_ui = LayoutLinkUI()
+    _current_ui.show(dockable=True)
 
-    return ui
+    return _current_ui
 
 
 # ============================================================================
 # AUTO-LAUNCH
 # ============================================================================
 
-if __name__ == "__main__" or __name__ == "maya_LayoutLink":
+# Only when run as a script (e.g. executed from the Script Editor); importing
+# the module doesn't open the panel - call show_ui() as the README shows
+if __name__ == "__main__":
     show_ui()
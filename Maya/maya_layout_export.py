@@ -4,9 +4,14 @@ Exports Maya layout with USD references to mesh library
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import maya_metadata_utils
 import animation_exporter
 import os
+import logging
+
+log = logging.getLogger("LayoutLink.layout_export")
 
 
 def get_maya_fps():
@@ -28,15 +33,54 @@ def get_maya_fps():
     return fps_map.get(time_unit, 24.0)
 
 
+# Characters that are not valid in USD prim names -> "_"
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*. '})
+
+# Mesh library file extensions, in lookup order
+MESH_EXTENSIONS = (".usdc", ".usda")
+
+
 def sanitize_name(name):
     """Clean up name for USD compatibility"""
-    invalid_chars = '<>:"/\\|?*. '
-    for char in invalid_chars:
-        name = name.replace(char, "_")
-    # Remove namespace and path separators
-    name = name.split(":")[-1]
-    name = name.split("|")[-1]
-    return name
+    # ":" and "|" are replaced too, so namespaces and DAG separators
+    # end up as underscores rather than being stripped
+    return name.translate(_SANITIZE_TABLE)
+
+
+def get_camera_attrs(camera_shape):
+    """
+    Read lens attributes from a Maya camera shape.
+    Uses MFnCamera so all values come from one node lookup
+    instead of a getAttr command per attribute.
+
+    Returns:
+        tuple: (focal_length_mm, h_aperture_inches, v_aperture_inches, near_clip, far_clip)
+    """
+    sel = om.MSelectionList()
+    sel.add(camera_shape)
+    camera_fn = om.MFnCamera(sel.getDagPath(0))
+
+    return (
+        camera_fn.focalLength,
+        camera_fn.horizontalFilmAperture,
+        camera_fn.verticalFilmAperture,
+        camera_fn.nearClippingPlane,
+        camera_fn.farClippingPlane,
+    )
+
+
+def get_world_matrix(node):
+    """
+    Get the world-space matrix of a node from its DAG path
+    (no xform command round-trip).
+
+    Returns:
+        list: 16 floats, row-major (same layout as Gf.Matrix4d)
+    """
+    sel = om.MSelectionList()
+    sel.add(node)
+    matrix = sel.getDagPath(0).inclusiveMatrix()
+    return [matrix[i] for i in range(16)]
 
 
 def get_relative_path(from_file, to_file):
@@ -58,7 +102,7 @@ def get_relative_path(from_file, to_file):
 
 
 def export_selected_to_usd(
-    file_path, asset_library_dir, start_frame=None, end_frame=None
+    file_path, asset_library_dir, start_frame=None, end_frame=None, selection=None
 ):
     """
     Export selected Maya objects to USD layout file with references to mesh library.
@@ -66,28 +110,32 @@ def export_selected_to_usd(
     Args:
         file_path (str): Where to save the layout USD file
         asset_library_dir (str): Directory containing exported mesh USD files
+        selection (list): Long names of the transforms to export, if the
+            caller already queried them (default: current selection)
 
     Returns:
         dict: Result with success status and object count
     """
-    print("=== Layout Export Starting ===")
-    print(f"Layout file: {file_path}")
-    print(f"Asset library: {asset_library_dir}")
-
     # STEP 1: Get selected objects
-    selected = cmds.ls(selection=True, long=True, transforms=True)
+    selected = selection
+    if selected is None:
+        selected = cmds.ls(selection=True, long=True, transforms=True)
 
     if not selected:
         print("No objects selected")
         return {"success": False, "error": "No objects selected"}
 
-    print(f"Exporting {len(selected)} object(s)")
+    log.debug(
+        "Layout export: %d object(s) -> %s (asset library: %s)",
+        len(selected), file_path, asset_library_dir
+    )
 
-# Get frame range from parameters or Maya timeline
+    # Get frame range from parameters or Maya timeline (the UI always passes
+    # both; the API getters avoid command dispatch for script callers)
     if start_frame is None:
-        start_frame = cmds.playbackOptions(query=True, minTime=True)
+        start_frame = oma.MAnimControl.minTime().value
     if end_frame is None:
-        end_frame = cmds.playbackOptions(query=True, maxTime=True)
+        end_frame = oma.MAnimControl.maxTime().value
     
     # Validate frame range
     if start_frame >= end_frame:
@@ -97,7 +145,7 @@ def export_selected_to_usd(
     
     fps = get_maya_fps()
 
-    print(f"Timeline range: {start_frame} - {end_frame} @ {fps} fps")
+    log.debug("Timeline range: %s - %s @ %s fps", start_frame, end_frame, fps)
 
     # STEP 2: Check if asset library exists (optional)
     asset_library_exists = os.path.exists(asset_library_dir)
@@ -105,21 +153,36 @@ def export_selected_to_usd(
         print(f"WARNING: Asset library not found: {asset_library_dir}")
         print("Exporting transforms only (no mesh references)")
 
+    # List the library once - per-mesh checks become set lookups, not stat calls.
+    # Filter on the name first so is_file() (a stat on some network shares)
+    # only runs for mesh files. Names are normcased like os.path.exists would
+    # match them (case-insensitive on Windows).
+    library_files = set()
+    if asset_library_exists:
+        try:
+            with os.scandir(asset_library_dir) as entries:
+                library_files = {
+                    os.path.normcase(entry.name) for entry in entries
+                    if os.path.normcase(entry.name).endswith(MESH_EXTENSIONS)
+                    and entry.is_file()
+                }
+        except OSError as e:
+            # Unreadable library - export without mesh references
+            log.warning("Could not list asset library %s: %s", asset_library_dir, e)
+
     # STEP 3: Import USD Python modules
     try:
-        from pxr import Usd, UsdGeom, Sdf
+        from pxr import Usd, UsdGeom, Sdf, Gf
     except ImportError:
         print("ERROR: USD Python modules not available")
         return {"success": False, "error": "USD not available"}
 
-    # STEP 4: Remove existing file and create new USD stage
+    # STEP 4: Create new USD stage
+    # CreateNew writes a fresh layer over any existing file, so there is no
+    # separate remove step. LoadNone: this stage is only written, never
+    # needs referenced payloads loaded.
     abs_file_path = os.path.abspath(file_path)
-    if os.path.exists(abs_file_path):
-        print(f"Removing existing file: {abs_file_path}")
-        os.remove(abs_file_path)
-
-    # Create new USD stage
-    stage = Usd.Stage.CreateNew(abs_file_path)
+    stage = Usd.Stage.CreateNew(abs_file_path, load=Usd.Stage.LoadNone)
 
     if not stage:
         print("ERROR: Failed to create USD stage")
@@ -132,7 +195,7 @@ def export_selected_to_usd(
     # NEW: Create /World root and set as default prim (matches Unreal structure)
     world_xform = UsdGeom.Xform.Define(stage, "/World")
     stage.SetDefaultPrim(world_xform.GetPrim())
-    print("USD Stage created with /World root")
+    log.debug("USD Stage created with /World root")
 
     # STEP 5: Process each selected object
     exported_count = 0
@@ -142,12 +205,30 @@ def export_selected_to_usd(
     cameras_exported = 0
     animated_objects = 0
 
-    for obj in selected:
-        obj_short_name = cmds.ls(obj, shortNames=True)[0]
+    # Gather shapes for the whole selection in one query, grouped by parent
+    all_shapes = (
+        cmds.listRelatives(selected, shapes=True, noIntermediate=True, fullPath=True)
+        or []
+    )
+    shapes_by_parent = {}
+    for shape in all_shapes:
+        shapes_by_parent.setdefault(shape.rsplit("|", 1)[0], []).append(shape)
+
+    # Classify shape types once instead of a nodeType call per shape
+    camera_shapes = set(cmds.ls(all_shapes, type="camera", long=True) or [])
+    mesh_shapes = set(cmds.ls(all_shapes, type="mesh", long=True) or [])
+
+    # Shortest unique names in one query (grp1|pCube1 when leaf names clash) -
+    # the same names maya_mesh_export gives the library files
+    short_names = cmds.ls(selected, shortNames=True) or []
+    if len(short_names) != len(selected):
+        short_names = [cmds.ls(obj, shortNames=True)[0] for obj in selected]
+
+    for obj, obj_short_name in zip(selected, short_names):
         obj_name = sanitize_name(obj_short_name)
         prim_path = f"/World/{obj_name}"
 
-        print(f"Processing: {obj_short_name}")
+        log.debug("Processing: %s", obj_short_name)
 
         # Initialize for this object
         is_camera = False
@@ -156,35 +237,30 @@ def export_selected_to_usd(
         prim_to_transform = None  # Will be set based on object type
 
         # Check what shapes this object has
-        shapes = cmds.listRelatives(
-            obj, shapes=True, noIntermediate=True, fullPath=True
-        )
+        shapes = shapes_by_parent.get(obj)
 
         if shapes:
             for shape in shapes:
-                node_type = cmds.nodeType(shape)
-
                 # CAMERA HANDLING
-                if node_type == "camera":
+                if shape in camera_shapes:
                     is_camera = True
-                    print(f"  Detected camera")
+                    log.debug("  Detected camera")
 
                     # Create USD camera prim
                     camera_prim = UsdGeom.Camera.Define(stage, prim_path)
 
                     # Get camera attributes
                     try:
-                        focal_length = (
-                            cmds.getAttr(f"{shape}.focalLength") / 10.0
-                        )  # mm to cm
-                        h_aperture = (
-                            cmds.getAttr(f"{shape}.horizontalFilmAperture") * 2.54
-                        )  # inches to cm
-                        v_aperture = (
-                            cmds.getAttr(f"{shape}.verticalFilmAperture") * 2.54
-                        )  # inches to cm
-                        near_clip = cmds.getAttr(f"{shape}.nearClipPlane")
-                        far_clip = cmds.getAttr(f"{shape}.farClipPlane")
+                        (
+                            focal_mm,
+                            h_aperture_in,
+                            v_aperture_in,
+                            near_clip,
+                            far_clip,
+                        ) = get_camera_attrs(shape)
+                        focal_length = focal_mm / 10.0  # mm to cm
+                        h_aperture = h_aperture_in * 2.54  # inches to cm
+                        v_aperture = v_aperture_in * 2.54  # inches to cm
 
                         # Set USD camera attributes
                         camera_prim.GetFocalLengthAttr().Set(focal_length)
@@ -192,32 +268,38 @@ def export_selected_to_usd(
                         camera_prim.GetVerticalApertureAttr().Set(v_aperture)
                         camera_prim.GetClippingRangeAttr().Set((near_clip, far_clip))
 
-                        print(
-                            f"  Camera attrs: focal={focal_length:.2f}cm, aperture={h_aperture:.2f}x{v_aperture:.2f}cm"
+                        log.debug(
+                            "  Camera attrs: focal=%.2fcm, aperture=%.2fx%.2fcm",
+                            focal_length,
+                            h_aperture,
+                            v_aperture,
                         )
                     except Exception as e:
-                        print(f"  Warning: Could not get all camera attributes: {e}")
+                        log.warning("%s: could not get all camera attributes: %s", obj_short_name, e)
 
                     cameras_exported += 1
                     prim_to_transform = camera_prim
                     break
 
                 # MESH HANDLING
-                elif node_type == "mesh":
+                elif shape in mesh_shapes:
                     has_mesh = True
-                    mesh_name = sanitize_name(obj_short_name)
-                    mesh_file = f"{mesh_name}.usda"
+                    # Library meshes are .usdc by default, .usda if exported as ASCII
+                    for extension in MESH_EXTENSIONS:
+                        mesh_file = f"{obj_name}{extension}"
+                        if os.path.normcase(mesh_file) in library_files:
+                            break
                     mesh_full_path = os.path.join(asset_library_dir, mesh_file)
 
                     # Check if mesh USD file exists
-                    if asset_library_exists and os.path.exists(mesh_full_path):
+                    if os.path.normcase(mesh_file) in library_files:
                         mesh_usd_path = get_relative_path(abs_file_path, mesh_full_path)
-                        print(f"  Mesh: {mesh_name} -> {mesh_usd_path}")
+                        log.debug("  Mesh: %s -> %s", obj_name, mesh_usd_path)
                     elif asset_library_exists:
-                        print(f"  WARNING: Mesh USD not found: {mesh_file}")
-                        missing_meshes.append(mesh_name)
+                        log.warning("Mesh USD not found: %s", mesh_file)
+                        missing_meshes.append(obj_name)
                     else:
-                        print(f"  Mesh: {mesh_name} (no reference - library not found)")
+                        log.debug("  Mesh: %s (no reference - library not found)", obj_name)
                     break
 
         # Create prim if not already created (cameras already have their prim)
@@ -230,7 +312,7 @@ def export_selected_to_usd(
                 references = xform_prim.GetReferences()
                 references.AddReference(mesh_usd_path)
                 objects_with_refs += 1
-                print(f"  ✓ Added reference to: {mesh_usd_path}")
+                log.debug("  Added reference to: %s", mesh_usd_path)
             else:
                 objects_without_refs += 1
 
@@ -246,82 +328,74 @@ def export_selected_to_usd(
         # SET TRANSFORM
         if prim_to_transform:
 
-            # Check if object has animation
-            if animation_exporter.is_animated(obj):
-                print(f"  Object is ANIMATED!")
-
-                # Export stepped animation (timeSamples)
-                anim_success = animation_exporter.export_stepped_animation(
-                    obj, prim_to_transform, start_frame, end_frame
-                )
-
-                if anim_success:
-                    animated_objects += 1
-
-            else:
-                # Static object - export single transform (existing code)
-                translation = cmds.xform(
-                    obj, query=True, worldSpace=True, translation=True
-                )
-                rotation = cmds.xform(obj, query=True, worldSpace=True, rotation=True)
-                scale = cmds.xform(obj, query=True, worldSpace=True, scale=True)
-
-                xformable = UsdGeom.Xformable(prim_to_transform)
-                xformable.ClearXformOpOrder()
+            # The prim already exists - batch its property edits into
+            # one change notification (prims must not be created inside
+            # a ChangeBlock, so this stays per-object)
+            with Sdf.ChangeBlock():
+                # Check if object has animation
+                if animation_exporter.is_animated(obj):
+                    log.debug("  Object is animated")
+
+                    # Export stepped animation (timeSamples)
+                    anim_success = animation_exporter.export_stepped_animation(
+                        obj, prim_to_transform, start_frame, end_frame
+                    )
 
-                # Add transform operations
-                translate_op = xformable.AddTranslateOp()
-                translate_op.Set((translation[0], translation[1], translation[2]))
+                    if anim_success:
+                        animated_objects += 1
 
-                # Maya rotation (XYZ order)
-                rotate_op = xformable.AddRotateXYZOp()
-                rotate_op.Set((rotation[0], rotation[1], rotation[2]))
+                else:
+                    # Static object - export single world matrix
+                    xformable = UsdGeom.Xformable(prim_to_transform)
+                    xformable.ClearXformOpOrder()
 
-                scale_op = xformable.AddScaleOp()
-                scale_op.Set((scale[0], scale[1], scale[2]))
+                    # One matrix4d xformOp:transform instead of T/R/S ops
+                    transform_op = xformable.AddTransformOp()
+                    transform_op.Set(Gf.Matrix4d(*get_world_matrix(obj)))
 
-            # Add original name attribute (for both animated and static)
-            if is_camera:
-                maya_label_attr = prim_to_transform.GetPrim().CreateAttribute(
-                    "maya:originalName", Sdf.ValueTypeNames.String
-                )
-            else:
-                # Handle both typed schemas and raw prims
-                if hasattr(prim_to_transform, "GetPrim"):
+                # Add original name attribute (for both animated and static)
+                if is_camera:
                     maya_label_attr = prim_to_transform.GetPrim().CreateAttribute(
                         "maya:originalName", Sdf.ValueTypeNames.String
                     )
                 else:
-                    maya_label_attr = prim_to_transform.CreateAttribute(
-                        "maya:originalName", Sdf.ValueTypeNames.String
-                    )
+                    # Handle both typed schemas and raw prims
+                    if hasattr(prim_to_transform, "GetPrim"):
+                        maya_label_attr = prim_to_transform.GetPrim().CreateAttribute(
+                            "maya:originalName", Sdf.ValueTypeNames.String
+                        )
+                    else:
+                        maya_label_attr = prim_to_transform.CreateAttribute(
+                            "maya:originalName", Sdf.ValueTypeNames.String
+                        )
 
-            maya_label_attr.Set(obj_short_name)
+                maya_label_attr.Set(obj_short_name)
 
         exported_count += 1
 
     # STEP 6: Add LayoutLink metadata
     root_layer = stage.GetRootLayer()
-    maya_metadata_utils.add_layoutlink_metadata(
-        root_layer, operation="maya_export", app="Maya"
-    )
+    with Sdf.ChangeBlock():
+        maya_metadata_utils.add_layoutlink_metadata(
+            root_layer, operation="maya_export", app="Maya"
+        )
 
-    # Add export statistics to metadata
-    custom_data = dict(root_layer.customLayerData)
-    custom_data["layoutlink_objects_with_refs"] = objects_with_refs
-    custom_data["layoutlink_objects_without_refs"] = objects_without_refs
-    custom_data["layoutlink_cameras_exported"] = cameras_exported
-    custom_data["layoutlink_asset_library"] = os.path.basename(asset_library_dir)
+        # Add export statistics to metadata
+        custom_data = dict(root_layer.customLayerData)
+        custom_data["layoutlink_objects_with_refs"] = objects_with_refs
+        custom_data["layoutlink_objects_without_refs"] = objects_without_refs
+        custom_data["layoutlink_cameras_exported"] = cameras_exported
+        custom_data["layoutlink_asset_library"] = os.path.basename(asset_library_dir)
 
-    # add Animation metadata
-    custom_data["layoutlink_has_animation"] = animated_objects > 0
-    custom_data["layoutlink_animation_type"] = "stepped"
-    custom_data["layoutlink_animated_objects"] = animated_objects
-    custom_data["layoutlink_start_frame"] = start_frame
-    custom_data["layoutlink_end_frame"] = end_frame
-    custom_data["layoutlink_fps"] = fps
+        # add Animation metadata
+        custom_data["layoutlink_has_animation"] = animated_objects > 0
+        custom_data["layoutlink_animation_type"] = "stepped"
+        custom_data["layoutlink_animated_objects"] = animated_objects
+        custom_data["layoutlink_start_frame"] = start_frame
+        custom_data["layoutlink_end_frame"] = end_frame
+        custom_data["layoutlink_fps"] = fps
 
-    root_layer.customLayerData = custom_data
+        root_layer.customLayerData = custom_data
 
     # STEP 7: Save the stage
     stage.Save()
@@ -329,22 +403,25 @@ def export_selected_to_usd(
     # Get file size for verification
     file_size = os.path.getsize(abs_file_path)
 
-    # Print summary
-    print("=" * 60)
-    print("Export Summary:")
-    print(f"  Total objects: {exported_count}")
-    print(f"  Animated objects: {animated_objects}")
-    print(f"  Meshes with references: {objects_with_refs}")
-    print(f"  Meshes without references: {objects_without_refs}")
-    print(f"  Cameras: {cameras_exported}")
+    # Print summary (one write to the Script Editor)
+    summary = [
+        "=" * 60,
+        "Export Summary:",
+        f"  Total objects: {exported_count}",
+        f"  Animated objects: {animated_objects}",
+        f"  Meshes with references: {objects_with_refs}",
+        f"  Meshes without references: {objects_without_refs}",
+        f"  Cameras: {cameras_exported}",
+    ]
     if missing_meshes:
-        print(f"  Missing mesh assets: {len(missing_meshes)}")
-        for mesh in missing_meshes:
-            print(f"    - {mesh}.usda")
-    print(f"  File size: {file_size} bytes")
-    print("=" * 60)
-    print(f"Saved: {abs_file_path}")
-    print("=== Layout Export Complete ===")
+        summary.append(f"  Missing mesh assets: {len(missing_meshes)}")
+        summary.extend(f"    - {mesh}" for mesh in missing_meshes)
+    summary += [
+        f"  File size: {file_size} bytes",
+        "=" * 60,
+        f"Saved: {abs_file_path}",
+    ]
+    print("\n".join(summary))
 
     # ========================================================================
     # LAYER MANAGEMENT
@@ -352,15 +429,12 @@ def export_selected_to_usd(
 
     import simple_layers
 
-    print("\n=== Layer Management ===")
-
     # Check if BASE layer already exists
     base_path = abs_file_path.replace(".usda", "_BASE.usda")
 
     if os.path.exists(base_path):
         # BASE exists - this is an UPDATE
-        print(f"Found existing BASE layer: {base_path}")
-        print("Creating Maya OVERRIDE layer...")
+        log.debug("Found existing BASE layer: %s - creating Maya OVERRIDE layer", base_path)
 
         # Create override layer (creates empty file with sublayer reference)
         over_path = simple_layers.create_override_layer(base_path, "maya")
@@ -375,9 +449,10 @@ def export_selected_to_usd(
         # Step 2: Rename our export to BE the override
         os.rename(abs_file_path, over_path)
 
-        # Step 3: Re-open and add sublayer reference
-        over_stage = Usd.Stage.Open(over_path)
-        over_root = over_stage.GetRootLayer()
+        # Step 3: Re-open the layer (no stage composition) and add sublayer reference
+        over_root = Sdf.Layer.FindOrOpen(over_path)
+        # The registry may hold an older copy of this path; re-read the renamed file
+        over_root.Reload()
         over_root.subLayerPaths.append(base_path)
 
         # Add override metadata
@@ -386,10 +461,9 @@ def export_selected_to_usd(
         custom_data["layoutlink_base_layer"] = base_path
         custom_data["layoutlink_app"] = "unreal"
         over_root.customLayerData = custom_data
-        over_stage.Save()
+        over_root.Save()
 
-        print(f"✓ Updated OVERRIDE: {over_path}")
-        print(f"✓ BASE layer safe: {base_path}")
+        print(f"✓ Updated OVERRIDE: {over_path} (BASE layer safe: {base_path})")
 
         return {
             "success": True,
@@ -407,8 +481,7 @@ def export_selected_to_usd(
     else:
         # No BASE exists - this is FIRST EX\
         # PORT
-        print("No BASE layer found")
-        print("Creating BASE layer...")
+        log.debug("No BASE layer found - creating BASE layer")
 
         # Create BASE from our export
         base_path = simple_layers.create_base_layer(abs_file_path)
@@ -416,8 +489,7 @@ def export_selected_to_usd(
         # Remove the temp export file (it's now copied to BASE)
         os.remove(abs_file_path)
 
-        print(f"✓ Created BASE layer: {base_path}")
-        print("✓ This is your source of truth - it won't be modified again")
+        print(f"✓ Created BASE layer: {base_path} (source of truth - won't be modified again)")
 
         return {
             "success": True,
@@ -7,56 +7,70 @@
 
 import os
 import maya.cmds as cmds
+import simple_layers
+import animation_exporter
 
 
-def _get_stage_up_axis(file_path):
-    try:
-        from pxr import Usd, UsdGeom
+# Set once mayaUsdPlugin is known to be loaded (it is not unloaded mid-session)
+_MAYAUSD_LOADED = False
+
 
-        stage = Usd.Stage.Open(file_path)
-        # Returns 'Y' or 'Z'
-        return UsdGeom.GetStageUpAxis(stage)
-    except Exception:
-        return None
+def ensure_mayausd_plugin():
+    """Make sure mayaUsdPlugin is loaded. Returns False if it can't be."""
+    global _MAYAUSD_LOADED
+    if _MAYAUSD_LOADED:
+        return True
 
+    if not cmds.pluginInfo("mayaUsdPlugin", query=True, loaded=True):
+        try:
+            cmds.loadPlugin("mayaUsdPlugin")
+            print("✓ Loaded mayaUsd plugin")
+        except Exception:
+            print("ERROR: Could not load mayaUsd plugin")
+            return False
 
-def import_usd_from_unreal(file_path, align_to_maya_up=True):
+    _MAYAUSD_LOADED = True
+    return True
+
+
+def probe_layout(file_path):
+    """
+    Read a layout's layer type, BASE path and up-axis.
+
+    Reads a private, header-only copy of the file (simple_layers' metadata
+    cache), never the registry layer a loaded stage may be editing, so the
+    UI can run it on a worker thread and pass the result to
+    import_usd_from_unreal.
+    """
+    # Detect if this is a layered file (type, BASE and up-axis in one read)
+    return simple_layers.inspect_layer(file_path)
+
+
+def import_usd_from_unreal(file_path, align_to_maya_up=True, probe=None):
     print("=== Layout Import Starting ===")
     print(f"File: {file_path}")
 
-    # Detect if this is a layered file
-    import simple_layers
-
-    layer_type = simple_layers.get_layer_type(file_path)
+    layer_info = probe if probe is not None else probe_layout(file_path)
+    layer_type = layer_info["layer_type"]
     print(f"Layer type: {layer_type}")
 
     if layer_type == "override":
-        base_path = simple_layers.get_base_from_override(file_path)
+        base_path = layer_info["base_layer"]
         if base_path:
             print(f"  References BASE: {base_path}")
+            print("  Importing layered USD (base + override)")
         else:
             print("  WARNING: Could not find BASE layer!")
 
-    if layer_type == "override":
-        base_path = simple_layers.get_base_from_override(file_path)
-        if base_path:
-            print(f"  Base layer: {base_path}")
-            print("  Importing layered USD (base + override)")
-
-    if not cmds.pluginInfo("mayaUsdPlugin", query=True, loaded=True):
-        try:
-            cmds.loadPlugin("mayaUsdPlugin")
-            print("✓ Loaded mayaUsd plugin")
-        except Exception:
-            print("ERROR: Could not load mayaUsd plugin")
-            return {"success": False, "error": "mayaUsd plugin not available"}
+    if not ensure_mayausd_plugin():
+        return {"success": False, "error": "mayaUsd plugin not available"}
 
     if not os.path.exists(file_path):
         print("ERROR: File not found")
         return {"success": False, "error": "File not found"}
 
     try:
-        up_axis = _get_stage_up_axis(file_path)  # 'Y' or 'Z' (or None on failure)
+        up_axis = layer_info["up_axis"]  # 'Y' or 'Z' (or None on failure)
         print(f"Stage upAxis: {up_axis}")
 
         base = os.path.splitext(os.path.basename(file_path))[0]
@@ -70,7 +84,7 @@ def import_usd_from_unreal(file_path, align_to_maya_up=True):
 
         # Ensure all draw purposes are enabled (make nothing hidden)
         for attr in ("drawRenderPurpose", "drawProxyPurpose", "drawGuidePurpose"):
-            if cmds.objExists(f"{shape}.{attr}"):
+            if cmds.attributeQuery(attr, node=shape, exists=True):
                 cmds.setAttr(f"{shape}.{attr}", 1)
 
         # Align Z-up USD stages to Maya's Y-up viewport (visual convenience)
@@ -86,9 +100,9 @@ def import_usd_from_unreal(file_path, align_to_maya_up=True):
         print(f"  Shape node: {shape}")
 
         #  Handle animation
-        import animation_exporter
-
         # Sync timeline from USD metadata
+        # (opens the root layer on the main thread; the proxy's stage shares
+        # that registry layer, and it's never reloaded here)
         if animation_exporter.set_timeline_from_usd(file_path):
             print("✓ Timeline synced from USD metadata")
 
@@ -118,7 +132,8 @@ def import_usd_from_unreal(file_path, align_to_maya_up=True):
         return {"success": False, "error": str(e)}
 
 
-def import_with_file_dialog(align_to_maya_up=True):
+def pick_layout_file():
+    """Ask for a USD layout to import. Returns the path, or None if cancelled."""
     file_path = cmds.fileDialog2(
         fileFilter="USD Files (*.usd *.usda *.usdc);;All Files (*.*)",
         dialogStyle=2,
@@ -126,8 +141,13 @@ def import_with_file_dialog(align_to_maya_up=True):
         caption="Import USD Layout from Unreal",
         startingDirectory="C:/SharedUSD/layouts/unreal_layouts",
     )
+    return file_path[0] if file_path else None
+
+
+def import_with_file_dialog(align_to_maya_up=True):
+    file_path = pick_layout_file()
     if file_path:
-        return import_usd_from_unreal(file_path[0], align_to_maya_up=align_to_maya_up)
+        return import_usd_from_unreal(file_path, align_to_maya_up=align_to_maya_up)
     else:
         print("Import cancelled")
         return {"success": False, "error": "Cancelled"}
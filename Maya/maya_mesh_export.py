@@ -5,56 +5,139 @@ Exports Maya meshes as individual USD assets using direct USD Python API
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import os
+import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pxr import Usd, UsdGeom, Sdf, Vt
 
+log = logging.getLogger("LayoutLink.mesh_export")
+
+# USD tokens / value types used for every mesh, looked up once
+_FACE_VARYING = UsdGeom.Tokens.faceVarying
+_SUBDIV_NONE = UsdGeom.Tokens.none
+_NORMAL3F_ARRAY = Sdf.ValueTypeNames.Normal3fArray
+_TEXCOORD2F_ARRAY = Sdf.ValueTypeNames.TexCoord2fArray
+_TOKEN = Sdf.ValueTypeNames.Token
+
+# Characters that are not valid in file names -> "_"
+_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 def get_all_meshes():
     """Find all mesh transforms in the scene"""
-    all_meshes = cmds.ls(type='mesh', long=True)
-    transforms = []
-    for mesh in all_meshes:
-        if cmds.getAttr(mesh + '.intermediateObject'):
-            continue
-        parents = cmds.listRelatives(mesh, parent=True, fullPath=True)
-        if parents:
-            transforms.append(parents[0])
+    # Filter intermediate objects and fetch all parents in one query each
+    all_meshes = cmds.ls(type='mesh', long=True, noIntermediate=True)
+    if not all_meshes:
+        return []
+    transforms = cmds.listRelatives(all_meshes, parent=True, fullPath=True) or []
     return list(set(transforms))
 
+def _get_mfn_mesh(shape_node):
+    """Get an MFnMesh for a mesh shape (API 2.0 bulk access to mesh data)"""
+    sel = om.MSelectionList()
+    sel.add(shape_node)
+    return om.MFnMesh(sel.getDagPath(0))
+
+def _to_vec3f_array(values):
+    """Vt.Vec3fArray from an MPointArray / MFloatVectorArray"""
+    return Vt.Vec3fArray([(v.x, v.y, v.z) for v in values])
+
+def _to_vec2f_array(us, vs):
+    """Vt.Vec2fArray from parallel U and V float arrays"""
+    return Vt.Vec2fArray(list(zip(us, vs)))
+
 def sanitize_filename(name):
     """Clean up name for filesystem"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    name = name.split(':')[-1]
-    name = name.split('|')[-1]
-    return name
-
-def export_mesh_to_usd(mesh_transform, output_dir):
+    # One pass; ':' and '|' become '_', so namespace/DAG parts stay in the name
+    return name.translate(_FILENAME_TABLE)
+
+def gather_mesh_data(mesh_transform):
     """
-    Export a single Maya mesh to USD using direct USD Python API.
+    Read everything needed to write a mesh asset from Maya.
+    
+    Must run on the main thread (cmds / OpenMaya). The returned dict holds
+    only plain Python and Vt values, so it can be handed to write_mesh_usd
+    on a worker thread.
     
     Args:
         mesh_transform: Maya transform node containing mesh
-        output_dir: Directory to save USD files
         
     Returns:
-        str: Path to exported file, or None if failed
+        dict: Mesh data, or None if the transform has no mesh shape
     """
     mesh_name = cmds.ls(mesh_transform, shortNames=True)[0]
-    safe_name = sanitize_filename(mesh_name)
-    output_path = os.path.join(output_dir, f"{safe_name}.usda")
     
-    print(f"Exporting mesh: {mesh_name}")
+    # Get the mesh shape node
+    shapes = cmds.listRelatives(mesh_transform, shapes=True, noIntermediate=True, fullPath=True)
+    if not shapes:
+        log.warning("No shape found for %s", mesh_name)
+        return None
     
-    try:
-        # Get the mesh shape node
-        shapes = cmds.listRelatives(mesh_transform, shapes=True, noIntermediate=True, fullPath=True)
-        if not shapes:
-            print(f"  No shape found for {mesh_name}")
-            return None
+    shape_node = shapes[0]
+    
+    # Get Maya mesh data
+    mesh_fn = _get_mfn_mesh(shape_node)
+    
+    data = {
+        "name": mesh_name,
+        "safe_name": sanitize_filename(mesh_name),
+    }
+    
+    # VERTICES - Use OBJECT space, not world space!
+    # One getPoints call instead of an xform query per vertex
+    data["points"] = _to_vec3f_array(mesh_fn.getPoints(om.MSpace.kObject))
+    
+    # FACE VERTEX COUNTS (how many vertices per face) and INDICES
+    # getVertices returns both arrays in one call
+    vertex_counts, vertex_indices = mesh_fn.getVertices()
+    data["face_vertex_counts"] = Vt.IntArray(list(vertex_counts))
+    data["face_vertex_indices"] = Vt.IntArray(list(vertex_indices))
+    
+    # NORMALS - getNormals is already the unique normal list and
+    # getNormalIds maps each face-vertex into it
+    _, normal_ids = mesh_fn.getNormalIds()
+    data["normals"] = _to_vec3f_array(mesh_fn.getNormals(om.MSpace.kObject))
+    data["normal_ids"] = Vt.IntArray(list(normal_ids))
+    
+    # UVs (if they exist)
+    data["uvs"] = None
+    uv_sets = mesh_fn.getUVSetNames()
+    if uv_sets:
+        uv_set = uv_sets[0]  # Use first UV set
+        us, vs = mesh_fn.getUVs(uv_set)
+        # Per face-vertex UV ids (face-varying indices into us/vs)
+        _, uv_ids = mesh_fn.getAssignedUVs(uv_set)
         
-        shape_node = shapes[0]
+        # Only valid as face-varying if every face-vertex has a UV
+        if len(us) > 0 and len(uv_ids) == len(vertex_indices):
+            data["uvs"] = _to_vec2f_array(us, vs)
+            data["uv_ids"] = Vt.IntArray(list(uv_ids))
+        elif len(us) > 0:
+            log.warning("%s: skipping UVs, not every face is mapped in '%s'", mesh_name, uv_set)
+    
+    return data
+
+def write_mesh_usd(data, output_path):
+    """
+    Write gathered mesh data to a USD asset file.
+    
+    Pure USD API (no Maya calls). It may run on a worker thread only when
+    output_path isn't already an open layer (Sdf.Layer.Find) - clearing a
+    layer a live stage uses sends change notices to its owner.
+    
+    Args:
+        data: Dict from gather_mesh_data
+        output_path: USD file to write (.usdc or .usda)
         
+    Returns:
+        str: Path to exported file, or None if failed
+    """
+    mesh_name = data["name"]
+    safe_name = data["safe_name"]
+    
+    try:
         # Remove old file from disk if it exists
         if os.path.exists(output_path):
             os.remove(output_path)
@@ -64,7 +147,7 @@ def export_mesh_to_usd(mesh_transform, output_dir):
         if existing_layer:
             # Clear the cached layer
             existing_layer.Clear()
-            print(f"  Cleared cached USD layer")
+            log.debug("  Cleared cached USD layer")
         
         # Create USD stage
         stage = Usd.Stage.CreateNew(output_path)
@@ -76,82 +159,48 @@ def export_mesh_to_usd(mesh_transform, output_dir):
         # Create mesh prim
         mesh_prim = UsdGeom.Mesh.Define(stage, f"/{safe_name}")
         
-        # Get Maya mesh data
-        # VERTICES - Use OBJECT space, not world space!
-        vtx_count = cmds.polyEvaluate(shape_node, vertex=True)
-        points = []
-        for i in range(vtx_count):
-            pos = cmds.xform(f"{shape_node}.vtx[{i}]", q=True, objectSpace=True, translation=True)
-            points.append((pos[0], pos[1], pos[2]))
-        
-        mesh_prim.GetPointsAttr().Set(points)
-        
-        # FACE VERTEX COUNTS (how many vertices per face)
-        face_count = cmds.polyEvaluate(shape_node, face=True)
-        face_vertex_counts = []
-        for i in range(face_count):
-            vtx_in_face = cmds.polyInfo(f"{shape_node}.f[{i}]", faceToVertex=True)[0]
-            # Parse result like "FACE     0:      0 1 2 3\n"
-            vtx_list = vtx_in_face.split(':')[1].strip().split()
-            face_vertex_counts.append(len(vtx_list))
-        
-        mesh_prim.GetFaceVertexCountsAttr().Set(face_vertex_counts)
-        
-        # FACE VERTEX INDICES
-        face_vertex_indices = []
-        for i in range(face_count):
-            vtx_in_face = cmds.polyInfo(f"{shape_node}.f[{i}]", faceToVertex=True)[0]
-            vtx_list = vtx_in_face.split(':')[1].strip().split()
-            face_vertex_indices.extend([int(v) for v in vtx_list])
-        
-        mesh_prim.GetFaceVertexIndicesAttr().Set(face_vertex_indices)
-        
-        # NORMALS
-        normals = []
-        for i in range(face_count):
-            for j in range(face_vertex_counts[i]):
-                normal = cmds.polyNormalPerVertex(
-                    f"{shape_node}.vtxFace[{face_vertex_indices[sum(face_vertex_counts[:i]) + j]}][{i}]",
-                    q=True, xyz=True
-                )
-                normals.append((normal[0], normal[1], normal[2]))
-        
-        mesh_prim.GetNormalsAttr().Set(normals)
-        mesh_prim.SetNormalsInterpolation(UsdGeom.Tokens.faceVarying)
-        
-        # UVs (if they exist)
-        uv_sets = cmds.polyUVSet(shape_node, q=True, allUVSets=True)
-        if uv_sets:
-            uv_set = uv_sets[0]  # Use first UV set
-            uvs = cmds.polyEditUV(f"{shape_node}.map[*]", q=True, uValue=True, vValue=True)
-            
-            if uvs and len(uvs) > 0:
-                # Interleave U and V into (u,v) pairs
-                uv_pairs = [(uvs[i], uvs[i+1]) for i in range(0, len(uvs), 2)]
-                
-                # Create primvar for UVs - must use GetPrim() not the mesh object directly
-                uv_primvar = UsdGeom.PrimvarsAPI(mesh_prim).CreatePrimvar(
-                    "st", 
-                    Sdf.ValueTypeNames.TexCoord2fArray,
-                    UsdGeom.Tokens.faceVarying
+        # The prim already exists - batch its property edits into one
+        # change notification (Save stays outside the block)
+        with Sdf.ChangeBlock():
+            mesh_prim.GetPointsAttr().Set(data["points"])
+            mesh_prim.GetFaceVertexCountsAttr().Set(data["face_vertex_counts"])
+            mesh_prim.GetFaceVertexIndicesAttr().Set(data["face_vertex_indices"])
+        
+            # NORMALS (indexed face-varying primvar)
+            # (primvars:normals takes precedence over the plain normals attr)
+            primvars_api = UsdGeom.PrimvarsAPI(mesh_prim)
+            normals_primvar = primvars_api.CreatePrimvar(
+                "normals", _NORMAL3F_ARRAY, _FACE_VARYING
+            )
+            normals_primvar.Set(data["normals"])
+            normals_primvar.SetIndices(data["normal_ids"])
+        
+            # UVs (if they exist)
+            if data["uvs"] is not None:
+                # Create primvar for UVs
+                uv_primvar = primvars_api.CreatePrimvar(
+                    "st", _TEXCOORD2F_ARRAY, _FACE_VARYING
                 )
-                uv_primvar.Set(uv_pairs)
+                uv_primvar.Set(data["uvs"])
+                uv_primvar.SetIndices(data["uv_ids"])
         
-        # Set subdivision scheme
-        mesh_prim.GetSubdivisionSchemeAttr().Set(UsdGeom.Tokens.none)
+            # Set subdivision scheme - authored straight on the new prim's
+            # spec in the root layer, skipping the schema attribute wrapper
+            prim_spec = stage.GetRootLayer().GetPrimAtPath(mesh_prim.GetPath())
+            subdiv_spec = Sdf.AttributeSpec(
+                prim_spec, "subdivisionScheme", _TOKEN, Sdf.VariabilityUniform
+            )
+            subdiv_spec.default = _SUBDIV_NONE
         
-        # Set as default prim
-        stage.SetDefaultPrim(mesh_prim.GetPrim())
+            # Set as default prim
+            stage.SetDefaultPrim(mesh_prim.GetPrim())
         
         # Save the stage
         stage.GetRootLayer().Save()
         
         # Verify file size
         file_size = os.path.getsize(output_path)
-        print(f"  ✓ Exported to: {output_path} ({file_size} bytes)")
-        
-        if file_size > 1000:
-            print(f"  ✓✓ SUCCESS! File has geometry data!")
+        log.debug("  Exported %s to: %s (%d bytes)", mesh_name, output_path, file_size)
         
         return output_path
         
@@ -161,13 +210,79 @@ def export_mesh_to_usd(mesh_transform, output_dir):
         traceback.print_exc()
         return None
 
-def export_mesh_library(output_dir, selected_only=False):
+# Sidecar in the library folder: {file name: mesh data digest}
+MESH_CACHE_FILE = ".layoutlink_cache.json"
+
+def _mesh_digest(data):
+    """Hash of the gathered mesh arrays (Vt arrays expose their raw buffer)"""
+    digest = hashlib.blake2b(data["safe_name"].encode("utf-8"), digest_size=16)
+    for key in ("points", "face_vertex_counts", "face_vertex_indices",
+                "normals", "normal_ids", "uvs", "uv_ids"):
+        value = data.get(key)
+        if value is not None:
+            digest.update(memoryview(value))
+    return digest.hexdigest()
+
+def _load_mesh_cache(output_dir):
+    try:
+        with open(os.path.join(output_dir, MESH_CACHE_FILE), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_mesh_cache(output_dir, cache):
+    try:
+        with open(os.path.join(output_dir, MESH_CACHE_FILE), "w") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Note: Could not write mesh cache: {e}")
+
+def _mesh_output_path(data, output_dir, binary):
+    # CreateNew picks the file format from the extension
+    extension = ".usdc" if binary else ".usda"
+    return os.path.join(output_dir, f"{data['safe_name']}{extension}")
+
+def export_mesh_to_usd(mesh_transform, output_dir, binary=True):
+    """
+    Export a single Maya mesh to USD using direct USD Python API.
+    
+    Args:
+        mesh_transform: Maya transform node containing mesh
+        output_dir: Directory to save USD files
+        binary: Write .usdc (crate) if True, ASCII .usda if False
+        
+    Returns:
+        str: Path to exported file, or None if failed
+    """
+    print(f"Exporting mesh: {mesh_transform}")
+    
+    try:
+        data = gather_mesh_data(mesh_transform)
+    except Exception as e:
+        print(f"  ✗ Failed to read {mesh_transform}: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+    
+    if data is None:
+        return None
+    
+    return write_mesh_usd(data, _mesh_output_path(data, output_dir, binary))
+
+def export_mesh_library(output_dir, selected_only=False, binary=True, force=False, selection=None):
     """
     Export Maya meshes to create a USD asset library.
     
+    Meshes whose data is unchanged since the last export into output_dir
+    (tracked in MESH_CACHE_FILE) are not rewritten unless force is True.
+    
     Args:
         output_dir: Directory where USD mesh files will be saved
         selected_only: If True, only export selected meshes
+        binary: Write .usdc (crate) if True, ASCII .usda if False
+        force: Rewrite every mesh, ignoring the cache
+        selection: Long names of the selected transforms, if the caller
+            already queried them (used with selected_only)
         
     Returns:
         dict: Export results
@@ -176,13 +291,15 @@ def export_mesh_library(output_dir, selected_only=False):
     print(f"Output directory: {output_dir}")
     
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    created = not os.path.isdir(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    if created:
         print(f"Created directory: {output_dir}")
     
     # Determine which meshes to export
     if selected_only:
-        selection = cmds.ls(selection=True, long=True, transforms=True)
+        if selection is None:
+            selection = cmds.ls(selection=True, long=True, transforms=True)
         meshes_to_export = []
         
         for obj in selection:
@@ -206,26 +323,88 @@ def export_mesh_library(output_dir, selected_only=False):
         print("No meshes to export")
         return {"success": False, "error": "No meshes found"}
     
-    # Export each mesh
     exported_meshes = []
     failed_meshes = []
     
+    # Read all mesh data on the main thread (Maya API is not thread safe)
+    gathered = []
     for mesh in meshes_to_export:
-        result = export_mesh_to_usd(mesh, output_dir)
+        log.debug("Reading mesh: %s", mesh)
+        try:
+            data = gather_mesh_data(mesh)
+        except Exception as e:
+            print(f"  ✗ Failed to read {mesh}: {e}")
+            data = None
         
+        if data:
+            gathered.append(data)
+        else:
+            failed_meshes.append(cmds.ls(mesh, shortNames=True)[0])
+    
+    # One writer per file - meshes sharing a short name overwrite each
+    # other (last one wins, same as exporting them one after another)
+    by_path = {}
+    for data in gathered:
+        by_path[_mesh_output_path(data, output_dir, binary)] = data
+    
+    # Skip meshes that are unchanged since the last export
+    cache = {} if force else _load_mesh_cache(output_dir)
+    digests = {}
+    unchanged_count = 0
+    for output_path, data in list(by_path.items()):
+        file_name = os.path.basename(output_path)
+        digests[file_name] = _mesh_digest(data)
+        if cache.get(file_name) == digests[file_name] and os.path.exists(output_path):
+            exported_meshes.append({
+                "name": data["name"],
+                "path": output_path
+            })
+            unchanged_count += 1
+            del by_path[output_path]
+    
+    output_paths = list(by_path)
+    gathered = list(by_path.values())
+    
+    # Files already open as layers (e.g. referenced by a layout loaded in a
+    # proxy shape) are rewritten here on the main thread, so mayaUsd sees
+    # their change notices where it expects them; the rest are built and
+    # saved in parallel (pure USD, no Maya calls)
+    results = {}
+    pooled = []
+    for output_path, data in by_path.items():
+        if Sdf.Layer.Find(output_path):
+            results[output_path] = write_mesh_usd(data, output_path)
+        else:
+            pooled.append(output_path)
+    
+    if pooled:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            pooled_results = executor.map(
+                write_mesh_usd, [by_path[path] for path in pooled], pooled
+            )
+            results.update(zip(pooled, pooled_results))
+    results = [results[path] for path in output_paths]
+    
+    for data, output_path, result in zip(gathered, output_paths, results):
+        file_name = os.path.basename(output_path)
         if result:
-            mesh_name = cmds.ls(mesh, shortNames=True)[0]
             exported_meshes.append({
-                "name": mesh_name,
+                "name": data["name"],
                 "path": result
             })
+            cache[file_name] = digests[file_name]
         else:
-            failed_meshes.append(cmds.ls(mesh, shortNames=True)[0])
+            failed_meshes.append(data["name"])
+            cache.pop(file_name, None)
+    
+    _save_mesh_cache(output_dir, cache)
     
     # Summary
     print("=" * 50)
     print(f"Export complete:")
     print(f"  Success: {len(exported_meshes)} meshes")
+    if unchanged_count:
+        print(f"  Unchanged (skipped): {unchanged_count} meshes")
     if failed_meshes:
         print(f"  Failed: {len(failed_meshes)} meshes")
     print("=" * 50)
@@ -234,14 +413,15 @@ def export_mesh_library(output_dir, selected_only=False):
         "success": True,
         "exported_count": len(exported_meshes),
         "failed_count": len(failed_meshes),
+        "unchanged_count": unchanged_count,
         "exported_meshes": exported_meshes,
         "failed_meshes": failed_meshes,
         "output_dir": output_dir
     }
 
-def export_selected_meshes_library(output_dir):
+def export_selected_meshes_library(output_dir, selection=None):
     """Convenience function: Export only selected meshes."""
-    return export_mesh_library(output_dir, selected_only=True)
+    return export_mesh_library(output_dir, selected_only=True, selection=selection)
 
 def export_all_meshes_library(output_dir):
     """Convenience function: Export all meshes in the scene."""
@@ -4,9 +4,22 @@ Used by both import and export scripts
 Matches the format used by Unreal
 """
 
-from datetime import datetime
+import time
 import os
 import getpass
+import functools
+
+# Keys LayoutLink writes into customLayerData
+LAYOUTLINK_KEYS = frozenset([
+    "layoutlink_timestamp", "layoutlink_artist",
+    "layoutlink_app", "layoutlink_operation", "layoutlink_version",
+])
+
+@functools.lru_cache(maxsize=None)
+def _artist():
+    # The login name doesn't change during a session
+    return getpass.getuser()
+
 
 def add_layoutlink_metadata(layer, operation="export", app="Maya"):
     """
@@ -19,13 +32,18 @@ def add_layoutlink_metadata(layer, operation="export", app="Maya"):
         app: Which app is creating the file
     """
     custom_data = {
-        "layoutlink_timestamp": datetime.utcnow().isoformat() + 'Z',
-        "layoutlink_artist": getpass.getuser(),
+        "layoutlink_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "layoutlink_artist": _artist(),
         "layoutlink_app": app,
         "layoutlink_operation": operation,
         "layoutlink_version": "0.1.0"
     }
     
+    # Merge so other customLayerData entries on the layer are kept
+    # (a freshly created layer has none - assign ours directly)
+    existing = layer.customLayerData
+    if existing:
+        custom_data = {**existing, **custom_data}
     layer.customLayerData = custom_data
     print("Added LayoutLink metadata to USD layer")
     
@@ -45,13 +63,7 @@ def read_layoutlink_metadata(layer):
         return None
     
     # Extract LayoutLink-specific keys
-    metadata = {}
-    keys = ["layoutlink_timestamp", "layoutlink_artist", 
-            "layoutlink_app", "layoutlink_operation", "layoutlink_version"]
-    
-    for key in keys:
-        if key in custom_data:
-            metadata[key] = custom_data[key]
+    metadata = {key: custom_data[key] for key in LAYOUTLINK_KEYS.intersection(custom_data)}
     
     return metadata if metadata else None
 
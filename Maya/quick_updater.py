@@ -18,26 +18,86 @@ Usage:
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import os
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import simple_layers
 
+log = logging.getLogger("LayoutLink.quick_updater")
+
+
+# Handles to the scene's proxy shapes (None = rescan). Cleared by the
+# callbacks below when proxy shapes are created/deleted or a scene loads.
+_PROXY_SHAPES = None
+
+# importlib.reload re-runs this module in the same namespace - remove the
+# previous copy's callbacks so they don't pile up with each reload
+if globals().get("_PROXY_SHAPE_CALLBACKS"):
+    om.MMessage.removeCallbacks(_PROXY_SHAPE_CALLBACKS)
+_PROXY_SHAPE_CALLBACKS = []
+
+
+def _forget_proxy_shapes(*args):
+    global _PROXY_SHAPES
+    _PROXY_SHAPES = None
+
+
+def _watch_proxy_shapes():
+    """Register the cache-clearing callbacks once; False if they can't be"""
+    if _PROXY_SHAPE_CALLBACKS:
+        return True
+    try:
+        _PROXY_SHAPE_CALLBACKS.extend((
+            om.MDGMessage.addNodeAddedCallback(_forget_proxy_shapes, 'mayaUsdProxyShape'),
+            om.MDGMessage.addNodeRemovedCallback(_forget_proxy_shapes, 'mayaUsdProxyShape'),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, _forget_proxy_shapes),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _forget_proxy_shapes)
+        ))
+    except Exception:
+        # e.g. mayaUsdPlugin not loaded yet - the node type is unknown
+        om.MMessage.removeCallbacks(_PROXY_SHAPE_CALLBACKS)
+        del _PROXY_SHAPE_CALLBACKS[:]
+        return False
+    return True
+
+
+def _proxy_shape_handles():
+    global _PROXY_SHAPES
+    if _PROXY_SHAPES is not None and all(handle.isValid() for handle in _PROXY_SHAPES):
+        return _PROXY_SHAPES
+    
+    sel = om.MSelectionList()
+    for shape in cmds.ls(type='mayaUsdProxyShape', long=True):
+        sel.add(shape)
+    handles = [om.MObjectHandle(sel.getDependNode(i)) for i in range(sel.length())]
+    
+    # Only keep the list if we'll hear about new shapes
+    _PROXY_SHAPES = handles if _watch_proxy_shapes() else None
+    return handles
+
 
 def list_all_usd_stages():
     """
     Find all USD stages in current Maya scene.
     
+    The proxy shapes are found with one scene-wide ls, then cached until a
+    proxy shape is created or deleted; names are read fresh from the DAG
+    each call, so renames and reparenting are picked up.
+    
     Returns:
         List of transform node names that have mayaUsdProxyShape children
     """
-    all_shapes = cmds.ls(type='mayaUsdProxyShape')
-    
-    stages = []
-    for shape in all_shapes:
-        parents = cmds.listRelatives(shape, parent=True, fullPath=True)
-        if parents:
-            stages.append(parents[0])
-    
-    return stages
+    stages = {}
+    for handle in _proxy_shape_handles():
+        shape = om.MDagPath.getAPathTo(handle.object()).fullPathName()
+        # Parent is the long path minus the last component (dict keeps
+        # order, drops repeats)
+        if shape.count('|') > 1:
+            stages[shape.rsplit('|', 1)[0]] = None
+    
+    return list(stages)
 
 
 def get_stage_info(stage_transform):
@@ -64,10 +124,7 @@ def get_stage_info(stage_transform):
     # Get app name if override
     app_name = None
     if layer_type == "override":
-        if "_maya_OVER" in file_path:
-            app_name = "maya"
-        elif "_unreal_OVER" in file_path:
-            app_name = "unreal"
+        app_name = simple_layers.classify_layer_path(file_path)[2]
     
     return {
         "transform": stage_transform,
@@ -97,7 +154,7 @@ def find_unreal_override_for_current(current_path):
     base_path = simple_layers.find_base_layer_for_file(current_path)
     
     if not base_path:
-        print(f"Could not find BASE layer for: {current_path}")
+        log.debug("Could not find BASE layer for: %s", current_path)
         return None
     
     # Now find Unreal override for that base
@@ -107,16 +164,129 @@ def find_unreal_override_for_current(current_path):
 
 
 def _get_stage_up_axis(file_path):
-    """Get up-axis from USD file"""
+    """
+    Get up-axis from USD file.
+    
+    Read from the root layer's metadata (cached until the file changes) -
+    no stage is composed just to answer this.
+    """
+    meta = simple_layers.read_layer_metadata(file_path)
+    return meta["up_axis"] if meta else None
+
+
+def _apply_coordinate_alignment(stage_transform, layer_type, up_axis=None):
+    """
+    Set the stage transform's rotateX for the layer it now shows.
+    
+    OVERRIDE layers have the coordinate conversion baked in (no rotation);
+    BASE layers get -90° in X if Z-up, none if Y-up.
+    """
+    if layer_type == "override":
+        target_rot_x = 0.0
+        applied_msg = "  Reset rotation (override has pre-converted coordinates)"
+        unchanged_msg = "  No rotation needed for override layer"
+    elif layer_type == "base":
+        if str(up_axis).upper() == "Z":
+            target_rot_x = -90.0
+            applied_msg = "  Applied -90° for Z-up BASE"
+        else:
+            target_rot_x = 0.0
+            applied_msg = "  Reset rotation for Y-up BASE"
+        unchanged_msg = None
+    else:
+        return
+    
+    current_rot_x = cmds.getAttr(f'{stage_transform}.rotateX') or 0.0
+    
+    if abs(current_rot_x - target_rot_x) > 0.01:
+        cmds.setAttr(f'{stage_transform}.rotateX', target_rot_x)
+        log.debug(applied_msg)
+    elif unchanged_msg:
+        log.debug(unchanged_msg)
+
+
+@contextmanager
+def _suspended_ui():
+    """
+    Suspend viewport refresh and Script Editor result echo while a batch
+    of stages is re-pointed, so each filePath change doesn't redraw.
+    """
+    suppressed = cmds.scriptEditorInfo(query=True, suppressResults=True)
+    cmds.scriptEditorInfo(suppressResults=True)
+    cmds.refresh(suspend=True)
     try:
-        from pxr import Usd, UsdGeom
-        stage = Usd.Stage.Open(file_path)
-        return UsdGeom.GetStageUpAxis(stage)
-    except Exception:
-        return None
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.scriptEditorInfo(suppressResults=suppressed)
+
+
+def _gather_update_plan(info, new_usd_path=None):
+    """
+    File-system / USD reads for one stage update (no Maya calls).
+    
+    Every USD read goes through simple_layers' metadata cache, which only
+    opens private, header-only anonymous layers - never the registry layers
+    a proxy shape's stage is using - so this can run on a worker thread.
+    update_existing_stage applies the result on the main thread.
+    
+    Args:
+        info: Dict from get_stage_info (read on the main thread)
+        new_usd_path: Path to new USD file (None = auto-find Unreal override)
+        
+    Returns:
+        Dict describing the update; "error" is set if it can't be done
+    """
+    current_path = info['file_path']
+    plan = {
+        "info": info,
+        "new_usd_path": new_usd_path,
+        "auto_found": not new_usd_path,
+        "error": None,
+        "old_up_axis": None,
+        "has_metadata": False,
+        "layer_type": "",
+        "app_source": "",
+        "new_up_axis": None
+    }
+    
+    # Auto-find Unreal override if not specified
+    if not new_usd_path:
+        new_usd_path = find_unreal_override_for_current(current_path)
+        if not new_usd_path:
+            plan["error"] = "No Unreal override found"
+            return plan
+        plan["new_usd_path"] = new_usd_path
+    
+    # Verify new file exists
+    if not os.path.exists(new_usd_path):
+        plan["error"] = f"File not found: {new_usd_path}"
+        return plan
+    
+    # OLD file's up-axis (reported before the path changes)
+    plan["old_up_axis"] = _get_stage_up_axis(current_path)
+    
+    # An <shot>_<app>_OVER.usda name already says what the file is, and
+    # overrides need no up-axis - only read metadata for anything else
+    kind, _, app = simple_layers.classify_layer_path(new_usd_path)
+    if kind == "override" and app:
+        plan["has_metadata"] = True
+        plan["app_source"] = app
+        plan["layer_type"] = kind
+        return plan
+    
+    # Layer type, source app and up-axis of the new file from one open
+    meta = simple_layers.read_layer_metadata(new_usd_path)
+    if meta:
+        plan["has_metadata"] = True
+        plan["app_source"] = meta["app"] or ""
+        plan["layer_type"] = meta["layer_type"] or ""
+        plan["new_up_axis"] = meta["up_axis"]
+    
+    return plan
 
 
-def update_existing_stage(stage_transform, new_usd_path=None):
+def update_existing_stage(stage_transform, new_usd_path=None, plan=None, refresh=True):
     """
     Update existing USD stage with new file.
     
@@ -126,60 +296,78 @@ def update_existing_stage(stage_transform, new_usd_path=None):
     Args:
         stage_transform: Transform node with mayaUsdProxyShape
         new_usd_path: Path to new USD file (None = auto-find Unreal override)
+        plan: Precomputed _gather_update_plan result (used by batch updates)
+        refresh: Redraw the viewport when done (batch updates redraw once)
         
     Returns:
         Dict with success status
     """
-    print("=" * 60)
-    print("=== Quick Update Starting ===")
-    print(f"Updating: {stage_transform}")
+    log.debug("Quick update: %s", stage_transform)
     
-    # Get stage info
-    info = get_stage_info(stage_transform)
-    
-    if not info:
-        error = "Not a valid USD stage"
-        print(f"ERROR: {error}")
-        return {"success": False, "error": error}
+    if plan is None:
+        # Get stage info
+        info = get_stage_info(stage_transform)
+        
+        if not info:
+            error = "Not a valid USD stage"
+            log.error("%s: %s", stage_transform, error)
+            return {"success": False, "error": error}
+        
+        plan = _gather_update_plan(info, new_usd_path)
     
+    info = plan["info"]
     shape_node = info['shape']
     current_path = info['file_path']
+    new_usd_path = plan["new_usd_path"]
     
-    print(f"Current file: {os.path.basename(current_path)}")
-    print(f"  Layer type: {info['layer_type']}")
+    log.debug("  Current file: %s (%s)", os.path.basename(current_path), info['layer_type'])
     
-    # Auto-find Unreal override if not specified
-    if not new_usd_path:
-        print("\nSearching for Unreal override layer...")
-        new_usd_path = find_unreal_override_for_current(current_path)
-        
+    if plan["auto_found"]:
         if not new_usd_path:
-            error = "No Unreal override found"
-            print(f"ERROR: {error}")
-            print("  Make sure Unreal has exported with the same shot name!")
-            return {"success": False, "error": error}
+            log.error(
+                "%s: %s - make sure Unreal has exported with the same shot name",
+                stage_transform, plan["error"]
+            )
+            return {"success": False, "error": plan["error"]}
         
-        print(f"[OK] Found: {os.path.basename(new_usd_path)}")
-    
-    # Verify new file exists
-    if not os.path.exists(new_usd_path):
-        error = f"File not found: {new_usd_path}"
-        print(f"ERROR: {error}")
-        return {"success": False, "error": error}
+        log.debug("  Found Unreal override: %s", os.path.basename(new_usd_path))
     
-    print(f"\nUpdating to: {os.path.basename(new_usd_path)}")
+    if plan["error"]:
+        log.error("%s: %s", stage_transform, plan["error"])
+        return {"success": False, "error": plan["error"]}
     
-    # Get OLD file's up-axis before updating
-    old_up_axis = _get_stage_up_axis(current_path)
-    print(f"  Old file up-axis: {old_up_axis}")
+    if os.path.normcase(os.path.normpath(new_usd_path)) == os.path.normcase(os.path.normpath(current_path)):
+        # Already showing this file - re-setting filePath won't pick up new
+        # edits, so reload the open layer instead (Reload() returns False when
+        # the file is unchanged on disk and the reload is skipped)
+        from pxr import Sdf
+        layer = Sdf.Layer.Find(new_usd_path)
+        reloaded = bool(layer and layer.Reload())
+        if reloaded:
+            log.info("%s reloaded %s", stage_transform, os.path.basename(new_usd_path))
+            if refresh:
+                cmds.refresh()
+        else:
+            log.info("%s already shows %s", stage_transform, os.path.basename(new_usd_path))
+        return {
+            "success": True,
+            "message": "Reloaded from disk" if reloaded else "Already up to date",
+            "reloaded": reloaded,
+            "stage": stage_transform,
+            "old_path": current_path,
+            "new_path": new_usd_path
+        }
+    
+    log.debug("  Updating to: %s", os.path.basename(new_usd_path))
+    log.debug("  Old file up-axis: %s", plan["old_up_axis"])
     
     # THE MAGIC: Just change the file path - Maya reloads automatically!
     try:
         cmds.setAttr(f'{shape_node}.filePath', new_usd_path, type='string')
-        print("[OK] File path updated")
+        log.debug("  File path updated")
     except Exception as e:
         error = f"Could not update file path: {e}"
-        print(f"ERROR: {error}")
+        log.error("%s: %s", stage_transform, error)
         return {"success": False, "error": error}
     
     # CRITICAL: Handle coordinate alignment for layer updates
@@ -190,57 +378,23 @@ def update_existing_stage(stage_transform, new_usd_path=None):
     # The Unreal exporter ALREADY converts Z-up → USD space with Y-flip
     # So we should NOT add parent rotation for OVERRIDE layers!
     
-    try:
-        from pxr import Sdf
-        
-        # Read OVERRIDE metadata to determine source
-        layer = Sdf.Layer.FindOrOpen(new_usd_path)
-        if layer:
-            custom_data = layer.customLayerData or {}
-            app_source = custom_data.get("layoutlink_app", "")
-            layer_type = custom_data.get("layoutlink_layer_type", "")
+    if not plan["has_metadata"]:
+        log.warning("%s: could not read layer metadata from %s", stage_transform, new_usd_path)
+    else:
+        try:
+            log.debug("  Layer type: %s, App: %s", plan["layer_type"], plan["app_source"])
             
-            print(f"  Layer type: {layer_type}, App: {app_source}")
-            
-            # For OVERRIDE layers, DON'T apply rotation
-            # The coordinate conversion is already baked in the USD data
-            if layer_type == "override":
-                current_rot_x = cmds.getAttr(f'{stage_transform}.rotateX') or 0.0
-                
-                if abs(current_rot_x) > 0.01:
-                    # Remove any rotation - override layers are pre-converted
-                    cmds.setAttr(f'{stage_transform}.rotateX', 0.0)
-                    print("  [OK] Reset rotation (override has pre-converted coordinates)")
-                else:
-                    print("  [OK] No rotation needed for override layer")
-            
-            # For BASE layers, check up-axis and apply rotation if needed
-            elif layer_type == "base":
-                base_up_axis = _get_stage_up_axis(new_usd_path)
-                current_rot_x = cmds.getAttr(f'{stage_transform}.rotateX') or 0.0
-                
-                if str(base_up_axis).upper() == "Z":
-                    if abs(current_rot_x - (-90.0)) > 0.01:
-                        cmds.setAttr(f'{stage_transform}.rotateX', -90.0)
-                        print("  [OK] Applied -90° for Z-up BASE")
-                else:
-                    if abs(current_rot_x) > 0.01:
-                        cmds.setAttr(f'{stage_transform}.rotateX', 0.0)
-                        print("  [OK] Reset rotation for Y-up BASE")
-                        
-    except Exception as e:
-        print(f"  Warning: Could not check layer metadata: {e}")
+            # OVERRIDE: no rotation (conversion already baked in the USD data)
+            # BASE: rotate only if the file is Z-up
+            _apply_coordinate_alignment(stage_transform, plan["layer_type"], plan["new_up_axis"])
+        except Exception as e:
+            log.warning("%s: could not check layer metadata: %s", stage_transform, e)
     
     # Force viewport refresh
-    cmds.refresh()
+    if refresh:
+        cmds.refresh()
     
-    print("=" * 60)
-    print("[SUCCESS] UPDATE COMPLETE!")
-    print("  Stage reloaded with Unreal changes")
-    print("  Coordinate system aligned")
-    print("  Animation preserved (if any)")
-    print(f"  Time: <10 seconds")
-    print("=" * 60)
+    log.info("Updated %s -> %s", stage_transform, os.path.basename(new_usd_path))
     
     return {
         "success": True,
@@ -258,30 +412,42 @@ def update_all_stages_to_unreal():
     Returns:
         Dict with results for each stage
     """
-    print("=== Updating All Stages to Unreal ===")
-    
     stages = list_all_usd_stages()
     
     if not stages:
-        print("No USD stages found in scene")
+        log.warning("No USD stages found in scene")
         return {"success": False, "error": "No stages"}
     
-    print(f"Found {len(stages)} stage(s)")
+    log.debug("Updating %d stage(s) to Unreal", len(stages))
     
     results = {}
     success_count = 0
     
-    for stage in stages:
-        print(f"\nProcessing: {stage}")
-        result = update_existing_stage(stage)
-        results[stage] = result
-        
-        if result["success"]:
-            success_count += 1
+    # Maya reads on the main thread, then the file/USD reads for every
+    # stage in parallel, then the Maya edits back on the main thread
+    infos = {stage: get_stage_info(stage) for stage in stages}
+    valid = [stage for stage in stages if infos[stage]]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        plans = dict(zip(valid, executor.map(
+            _gather_update_plan, [infos[stage] for stage in valid]
+        )))
+    
+    with _suspended_ui():
+        for stage in stages:
+            if stage in plans:
+                result = update_existing_stage(stage, plan=plans[stage], refresh=False)
+            else:
+                # Not a valid stage - let update_existing_stage report it
+                result = update_existing_stage(stage, refresh=False)
+            results[stage] = result
+            
+            if result["success"]:
+                success_count += 1
     
-    print("\n" + "=" * 60)
-    print(f"Updated {success_count}/{len(stages)} stages")
-    print("=" * 60)
+    # One redraw for the whole batch
+    cmds.refresh()
+    
+    log.info("Updated %d/%d stages", success_count, len(stages))
     
     return {
         "success": True,
@@ -301,8 +467,6 @@ def switch_to_base_layer(stage_transform):
     Returns:
         Dict with success status
     """
-    print("=== Switching to BASE Layer ===")
-    
     info = get_stage_info(stage_transform)
     if not info:
         return {"success": False, "error": "Not a valid stage"}
@@ -314,15 +478,17 @@ def switch_to_base_layer(stage_transform):
     
     if not base_path:
         error = "Could not find BASE layer"
-        print(f"ERROR: {error}")
+        log.error("%s: %s", stage_transform, error)
         return {"success": False, "error": error}
     
     if current_path == base_path:
-        print("Already viewing BASE layer")
+        log.debug("%s: already viewing BASE layer", stage_transform)
         return {"success": True, "message": "Already on BASE"}
     
-    print(f"Switching from: {os.path.basename(current_path)}")
-    print(f"           to: {os.path.basename(base_path)}")
+    log.debug(
+        "Switching %s from %s to %s",
+        stage_transform, os.path.basename(current_path), os.path.basename(base_path)
+    )
     
     # Update file path
     cmds.setAttr(f'{info["shape"]}.filePath', base_path, type='string')
@@ -330,13 +496,15 @@ def switch_to_base_layer(stage_transform):
     # Re-check coordinate system for BASE file
     base_up_axis = _get_stage_up_axis(base_path)
     if base_up_axis and str(base_up_axis).upper() == "Y":
-        # BASE is Y-up, remove rotation
-        cmds.setAttr(f'{stage_transform}.rotateX', 0.0)
-        print("  Removed rotation for Y-up BASE")
+        # BASE is Y-up, remove rotation (only write the plug if it's set)
+        rot_plug = f'{stage_transform}.rotateX'
+        if abs(cmds.getAttr(rot_plug) or 0.0) > 0.01:
+            cmds.setAttr(rot_plug, 0.0)
+            log.debug("  Removed rotation for Y-up BASE")
     
     cmds.refresh()
     
-    print("[OK] Switched to BASE layer")
+    log.info("Switched %s to BASE layer", stage_transform)
     
     return {
         "success": True,
@@ -16,8 +16,14 @@ Usage:
     # Creates: shot_001_maya_OVER.usda
 """
 
-from pxr import Usd, UsdGeom, Sdf
+# pxr is imported inside the functions that use it, so importing this
+# module (e.g. via quick_updater) doesn't pay for loading USD
 import os
+import re
+import logging
+import functools
+
+log = logging.getLogger("LayoutLink.layers")
 
 # ============================================================================
 # LAYER CREATION
@@ -39,31 +45,35 @@ def create_base_layer(export_path):
         >>> print(base)
         C:/SharedUSD/layouts/shot_001_BASE.usda
     """
+    from pxr import Usd
+    
     # Generate BASE filename
     base_path = export_path.replace(".usda", "_BASE.usda")
     
-    print(f"Creating BASE layer from: {export_path}")
+    log.debug("Creating BASE layer from: %s", export_path)
     
     # Open source file
     source_stage = Usd.Stage.Open(export_path)
     if not source_stage:
         raise RuntimeError(f"Could not open source file: {export_path}")
     
-    # Export to BASE file (makes a copy)
-    source_stage.Export(base_path)
-    
-    # Add metadata marking this as BASE
-    base_layer = Sdf.Layer.FindOrOpen(base_path)
-    if base_layer:
-        custom_data = dict(base_layer.customLayerData or {})
-        custom_data["layoutlink_layer_type"] = "base"
-        custom_data["layoutlink_locked"] = True
-        custom_data["layoutlink_created_from"] = os.path.basename(export_path)
-        base_layer.customLayerData = custom_data
-        base_layer.Save()
+    # Flatten in memory (same content Stage.Export writes), mark it as
+    # BASE, then write it once - no re-open of the file just written
+    base_layer = source_stage.Flatten()
+    custom_data = {
+        "layoutlink_layer_type": "base",
+        "layoutlink_locked": True,
+        "layoutlink_created_from": os.path.basename(export_path)
+    }
+    # Keep the exporter's metadata (if any) underneath the BASE keys
+    existing = base_layer.customLayerData
+    if existing:
+        custom_data = {**existing, **custom_data}
+    base_layer.customLayerData = custom_data
+    base_layer.Export(base_path)
+    invalidate_cache()
     
-    print(f"✓ Created BASE layer: {base_path}")
-    print("  This is your source of truth - it won't be modified")
+    log.info("Created BASE layer: %s", base_path)
     
     return base_path
 
@@ -84,20 +94,17 @@ def create_override_layer(base_path, app_name):
         >>> print(over)
         shot_001_maya_OVER.usda
     """
+    from pxr import Sdf
+    
     # Generate OVERRIDE filename
-    base_dir = os.path.dirname(base_path)
-    base_name = os.path.basename(base_path).replace("_BASE.usda", "")
+    base_dir, base_name = _stem_of(base_path)
     
     over_path = os.path.join(base_dir, f"{base_name}_{app_name}_OVER.usda")
     
-    print(f"Creating OVERRIDE layer: {over_path}")
-    print(f"  References: {base_path}")
+    log.debug("Creating OVERRIDE layer: %s (sublayers %s)", over_path, base_path)
     
-    # Create new stage
-    stage = Usd.Stage.CreateNew(over_path)
-    
-    # Get root layer and add BASE as sublayer
-    root_layer = stage.GetRootLayer()
+    # Create the layer directly - no stage needed to author sublayers/metadata
+    root_layer = Sdf.Layer.CreateNew(over_path)
     root_layer.subLayerPaths.append(base_path)
     
     # Add metadata
@@ -108,14 +115,138 @@ def create_override_layer(base_path, app_name):
     }
     root_layer.customLayerData = custom_data
     
-    stage.Save()
+    root_layer.Save()
+    invalidate_cache()
     
-    print(f"✓ Created OVERRIDE layer: {over_path}")
-    print(f"  Sublayers BASE: {base_path}")
+    log.info("Created OVERRIDE layer: %s", over_path)
     
     return over_path
 
 
+# ============================================================================
+# FILENAME PATTERNS
+# ============================================================================
+
+# <stem>_BASE.usda  or  <stem>[_maya|_unreal]_OVER.usda
+_LAYER_RE = re.compile(
+    r"^(?P<stem>.*?)(?:(?P<base>_BASE)|(?:_(?P<app>maya|unreal))?_OVER)\.usda$"
+)
+
+
+def classify_layer_path(usd_path):
+    """
+    Classify a layer by its filename in one regex match.
+    
+    Returns:
+        (kind, stem, app): kind is "base", "override" or None; stem is the
+        path without the layer suffix; app is "maya"/"unreal" for their
+        override layers, else None
+    """
+    match = _LAYER_RE.match(usd_path)
+    if not match:
+        return None, None, None
+    kind = "base" if match.group("base") else "override"
+    return kind, match.group("stem"), match.group("app")
+
+
+@functools.lru_cache(maxsize=1024)
+def _stem_of(base_path):
+    """
+    Split a BASE layer path into (folder, shot name).
+    
+    <folder>/shot_001_BASE.usda -> (<folder>, "shot_001"); other file
+    names are returned whole.
+    """
+    base_dir, name = os.path.split(base_path)
+    kind, stem, _ = classify_layer_path(name)
+    return base_dir, stem if kind == "base" else name
+
+
+def _base_path_from_name(over_path):
+    """BASE path for a maya/unreal OVERRIDE filename, if that file exists"""
+    kind, stem, app = classify_layer_path(over_path)
+    if kind != "override" or not app:
+        return None
+    base_path = stem + "_BASE.usda"
+    return base_path if os.path.exists(base_path) else None
+
+
+# ============================================================================
+# LAYER METADATA CACHE
+# ============================================================================
+
+def _layer_meta(layer):
+    """LayoutLink facts from an open root layer"""
+    from pxr import UsdGeom
+    
+    custom_data = layer.customLayerData or {}
+    # Stage metadata only comes from the root layer
+    root = layer.pseudoRoot
+    if root.HasInfo("upAxis"):
+        up_axis = root.GetInfo("upAxis")
+    else:
+        up_axis = UsdGeom.GetFallbackUpAxis()
+    
+    return {
+        "layer_type": custom_data.get("layoutlink_layer_type"),
+        "app": custom_data.get("layoutlink_app"),
+        "base_layer": custom_data.get("layoutlink_base_layer"),
+        "up_axis": up_axis
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _read_meta_cached(usd_path, mtime_ns):
+    from pxr import Sdf
+    
+    try:
+        # Private, header-only copy of what's on disk: never the registry
+        # layer a live stage (possibly with unsaved edits) is using
+        layer = Sdf.Layer.OpenAsAnonymous(usd_path, metadataOnly=True)
+        if not layer:
+            return None
+        return _layer_meta(layer)
+    except Exception:
+        return None
+
+
+def _read_meta(usd_path):
+    """
+    LayoutLink metadata for a USD file, cached by (path, mtime).
+    
+    Returns:
+        Dict with "layer_type", "app", "base_layer", "up_axis",
+        or None if the file is missing or unreadable
+    """
+    try:
+        mtime_ns = os.stat(usd_path).st_mtime_ns
+    except OSError:
+        return None
+    return _read_meta_cached(usd_path, mtime_ns)
+
+
+def read_layer_metadata(usd_path):
+    """
+    LayoutLink metadata and up-axis for a USD file, from one (cached)
+    open of its root layer - no stage is composed.
+    
+    Args:
+        usd_path: Path to USD file
+        
+    Returns:
+        Dict with "layer_type", "app", "base_layer", "up_axis",
+        or None if the file is missing or unreadable
+    """
+    meta = _read_meta(usd_path)
+    # Copy so callers can't modify the cached entry
+    return dict(meta) if meta else None
+
+
+def invalidate_cache():
+    """Forget cached layer metadata (called after LayoutLink writes a layer)"""
+    _read_meta_cached.cache_clear()
+
+
 # ============================================================================
 # LAYER DETECTION
 # ============================================================================
@@ -131,22 +262,12 @@ def is_base_layer(usd_path):
         True if BASE layer, False otherwise
     """
     # Quick check: filename pattern
-    if "_BASE.usda" in usd_path:
+    if classify_layer_path(usd_path)[0] == "base":
         return True
     
     # Thorough check: read metadata
-    if not os.path.exists(usd_path):
-        return False
-    
-    try:
-        layer = Sdf.Layer.FindOrOpen(usd_path)
-        if layer:
-            custom_data = layer.customLayerData or {}
-            return custom_data.get("layoutlink_layer_type") == "base"
-    except:
-        pass
-    
-    return False
+    meta = _read_meta(usd_path)
+    return bool(meta) and meta["layer_type"] == "base"
 
 
 def is_override_layer(usd_path):
@@ -160,22 +281,12 @@ def is_override_layer(usd_path):
         True if OVERRIDE layer, False otherwise
     """
     # Quick check: filename pattern
-    if "_OVER.usda" in usd_path:
+    if classify_layer_path(usd_path)[0] == "override":
         return True
     
     # Thorough check: read metadata
-    if not os.path.exists(usd_path):
-        return False
-    
-    try:
-        layer = Sdf.Layer.FindOrOpen(usd_path)
-        if layer:
-            custom_data = layer.customLayerData or {}
-            return custom_data.get("layoutlink_layer_type") == "override"
-    except:
-        pass
-    
-    return False
+    meta = _read_meta(usd_path)
+    return bool(meta) and meta["layer_type"] == "override"
 
 
 def get_layer_type(usd_path):
@@ -216,8 +327,7 @@ def find_override_layer(base_path, app_name):
         >>> if over:
         >>>     print(f"Found: {over}")
     """
-    base_dir = os.path.dirname(base_path)
-    base_name = os.path.basename(base_path).replace("_BASE.usda", "")
+    base_dir, base_name = _stem_of(base_path)
     
     over_path = os.path.join(base_dir, f"{base_name}_{app_name}_OVER.usda")
     
@@ -235,26 +345,15 @@ def get_base_from_override(over_path):
         Path to BASE layer, or None if not found
     """
     # Try reading from metadata
-    try:
-        layer = Sdf.Layer.FindOrOpen(over_path)
-        if layer:
-            custom_data = layer.customLayerData or {}
-            base_path = custom_data.get("layoutlink_base_layer")
-            
-            if base_path and os.path.exists(base_path):
-                return base_path
-    except:
-        pass
+    meta = _read_meta(over_path)
+    if meta:
+        base_path = meta["base_layer"]
+        
+        if base_path and os.path.exists(base_path):
+            return base_path
     
     # Try filename pattern
-    if "_maya_OVER.usda" in over_path:
-        base_path = over_path.replace("_maya_OVER.usda", "_BASE.usda")
-    elif "_unreal_OVER.usda" in over_path:
-        base_path = over_path.replace("_unreal_OVER.usda", "_BASE.usda")
-    else:
-        return None
-    
-    return base_path if os.path.exists(base_path) else None
+    return _base_path_from_name(over_path)
 
 
 def find_base_layer_for_file(file_path):
@@ -284,6 +383,10 @@ def find_base_layer_for_file(file_path):
 # LAYER INFO
 # ============================================================================
 
+# Apps that write OVERRIDE layers, in the order get_layer_info lists them
+_OVERRIDE_APPS = ("maya", "unreal")
+
+
 def get_layer_info(usd_path):
     """
     Get complete information about a layer.
@@ -308,15 +411,30 @@ def get_layer_info(usd_path):
     # Detect type
     info["layer_type"] = get_layer_type(usd_path)
     
-    # If BASE, find overrides
+    # If BASE, find overrides (<base>_<app>_OVER.usda) in one folder scan
     if info["layer_type"] == "base":
-        maya_over = find_override_layer(usd_path, "maya")
-        unreal_over = find_override_layer(usd_path, "unreal")
+        base_dir, base_name = _stem_of(usd_path)
+        prefix = os.path.normcase(base_name + "_")
+        suffix = os.path.normcase("_OVER.usda")
+        
+        overrides = {}
+        try:
+            with os.scandir(base_dir or ".") as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    if not (name.startswith(prefix) and name.endswith(suffix)):
+                        continue
+                    # Middle token must be a known app, so e.g.
+                    # shot_002_maya_OVER isn't taken as an override of "shot"
+                    app = name[len(prefix):-len(suffix)]
+                    if app in _OVERRIDE_APPS:
+                        overrides[app] = os.path.join(base_dir, entry.name)
+        except OSError:
+            pass
         
-        if maya_over:
-            info["override_layers"].append(maya_over)
-        if unreal_over:
-            info["override_layers"].append(unreal_over)
+        info["override_layers"] = [
+            overrides[app] for app in _OVERRIDE_APPS if app in overrides
+        ]
     
     # If OVERRIDE, find base
     elif info["layer_type"] == "override":
@@ -325,6 +443,45 @@ def get_layer_info(usd_path):
     return info
 
 
+def inspect_layer(usd_path):
+    """
+    Read layer type, BASE path and up-axis from one open of the root layer.
+    
+    Same answers as get_layer_type / get_base_from_override /
+    UsdGeom.GetStageUpAxis, without opening the file once per question.
+    
+    Args:
+        usd_path: Path to USD file
+        
+    Returns:
+        Dict with "layer_type", "base_layer" and "up_axis" ('Y', 'Z' or None)
+    """
+    info = {
+        "layer_type": "unknown",
+        "base_layer": None,
+        "up_axis": None
+    }
+    
+    meta = _read_meta(usd_path)
+    if not meta:
+        meta = {"layer_type": None, "base_layer": None, "up_axis": None}
+    info["up_axis"] = meta["up_axis"]
+    
+    layer_type = meta["layer_type"]
+    name_kind = classify_layer_path(usd_path)[0]
+    if name_kind == "base" or layer_type == "base":
+        info["layer_type"] = "base"
+    elif name_kind == "override" or layer_type == "override":
+        info["layer_type"] = "override"
+        
+        base_path = meta["base_layer"]
+        if not (base_path and os.path.exists(base_path)):
+            base_path = _base_path_from_name(usd_path)
+        info["base_layer"] = base_path
+    
+    return info
+
+
 def print_layer_info(usd_path):
     """Print layer information (for debugging)"""
     info = get_layer_info(usd_path)